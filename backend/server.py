@@ -1,32 +1,676 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.concurrency import run_in_threadpool
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT, ReturnDocument, ReplaceOne, DeleteOne, UpdateOne, monitoring
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure, PyMongoError
+from pymongo.read_preferences import Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest
 import os
+import time
+import asyncio
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter
+from pydantic_core import to_json
 from typing import List, Optional
+from collections import OrderedDict
 import uuid
+import json
+import base64
+import hashlib
+import hmac
+import re
+import threading
+import heapq
+import random
+import smtplib
+from email.message import EmailMessage
+import csv
+import io
 from datetime import datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
 import jwt
+import bcrypt
+import requests
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+MONGO_SLOW_QUERY_MS = float(os.environ.get('MONGO_SLOW_QUERY_MS', '100'))
+COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() == 'true'
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', '4'))
+PUBLIC_CACHE_MAX_AGE = int(os.environ.get('PUBLIC_CACHE_MAX_AGE', '60'))
+
+# Motor/pymongo client options that can be tuned per deployment, keyed by env var.
+MONGO_CLIENT_ENV_OPTIONS = {
+    'MONGO_MAX_POOL_SIZE': ('maxPoolSize', int),
+    'MONGO_MIN_POOL_SIZE': ('minPoolSize', int),
+    'MONGO_MAX_IDLE_TIME_MS': ('maxIdleTimeMS', int),
+    'MONGO_MAX_CONNECTING': ('maxConnecting', int),
+    'MONGO_WAIT_QUEUE_TIMEOUT_MS': ('waitQueueTimeoutMS', int),
+    'MONGO_CONNECT_TIMEOUT_MS': ('connectTimeoutMS', int),
+    'MONGO_SOCKET_TIMEOUT_MS': ('socketTimeoutMS', int),
+    'MONGO_SERVER_SELECTION_TIMEOUT_MS': ('serverSelectionTimeoutMS', int),
+    'MONGO_READ_PREFERENCE': ('readPreference', str),
+    'MONGO_COMPRESSORS': ('compressors', str),
+}
+
+# Heavy admin reads may go to secondaries; writes stay on the primary, and so
+# do reads from a client that wrote within READ_YOUR_WRITES_WINDOW seconds.
+# Admin writes answer with ADMIN_WRITE_HEADER and clients echo it on reads.
+ADMIN_READ_PREFERENCE = os.environ.get('ADMIN_READ_PREFERENCE', 'primary')
+ADMIN_READ_MAX_STALENESS = int(os.environ.get('ADMIN_READ_MAX_STALENESS', '-1'))
+READ_YOUR_WRITES_WINDOW = float(os.environ.get('READ_YOUR_WRITES_WINDOW', '5'))
+ADMIN_WRITE_HEADER = 'X-Admin-Write-At'
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Thread-safe Prometheus-style histogram keyed by a tuple of label values."""
+
+    def __init__(self, name: str, help_text: str, label_names: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float):
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = {"buckets": [0] * len(LATENCY_BUCKETS), "sum": 0.0, "count": 0}
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    series["buckets"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for labels, series in sorted(self.series.items()):
+                label_text = ",".join(
+                    f'{name}="{prometheus_escape(value)}"' for name, value in zip(self.label_names, labels)
+                )
+                for bound, count in zip(LATENCY_BUCKETS, series["buckets"]):
+                    lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {count}')
+                lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {series["count"]}')
+                lines.append(f"{self.name}_sum{{{label_text}}} {series['sum']}")
+                lines.append(f"{self.name}_count{{{label_text}}} {series['count']}")
+        return lines
+
+
+def prometheus_escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+request_latency = Histogram(
+    "http_request_duration_seconds", "Request latency by route template.", ("method", "route", "status"),
+)
+mongo_command_latency = Histogram(
+    "mongo_command_duration_seconds", "Mongo command latency by collection.", ("collection", "command", "outcome"),
+)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Time every Mongo command per collection and log the slow ones."""
+
+    def __init__(self):
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    def started(self, event):
+        # getMore names its collection separately; its command value is the cursor id
+        target = event.command.get("collection" if event.command_name == "getMore" else event.command_name)
+        collection = target if isinstance(target, str) else "-"
+        with self.lock:
+            self.in_flight[(event.connection_id, event.request_id)] = collection
+
+    def record(self, event, outcome: str):
+        with self.lock:
+            collection = self.in_flight.pop((event.connection_id, event.request_id), "-")
+        seconds = event.duration_micros / 1e6
+        mongo_command_latency.observe((collection, event.command_name, outcome), seconds)
+        if seconds * 1000 >= MONGO_SLOW_QUERY_MS:
+            logger.warning("Slow Mongo %s on %s took %.1fms", event.command_name, collection, seconds * 1000)
+
+    def succeeded(self, event):
+        self.record(event, "success")
+
+    def failed(self, event):
+        self.record(event, "failure")
+
+
+class RequestMetricsMiddleware:
+    """Record per-route latency, labelled with the route template rather than the raw path."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            request_latency.observe(
+                (scope["method"], route.path if route else "unmatched", str(status["code"])),
+                time.perf_counter() - started,
+            )
+
+
+mongo_metrics = MongoCommandMetrics()
+
+class BrotliResponder:
+    """Brotli counterpart of starlette's GZipResponder, flushing each streamed chunk."""
+
+    def __init__(self, app, minimum_size: int, quality: int):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressor = brotli.Compressor(quality=quality)
+        self.initial_message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_with_brotli)
+
+    async def send_with_brotli(self, message):
+        if message["type"] == "http.response.start":
+            # Hold the headers back until we know whether the body gets compressed
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            if self.passthrough or (len(body) < self.minimum_size and not more_body):
+                self.passthrough = True
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = "br"
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                message["body"] = self.compressor.process(body) + self.compressor.flush()
+            else:
+                message["body"] = self.compressor.process(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        chunk = self.compressor.process(body)
+        message["body"] = chunk + (self.compressor.flush() if more_body else self.compressor.finish())
+        await self.send(message)
+
+
+class CompressionMiddleware:
+    """Compress responses over minimum_size with brotli when the client and server support it, else gzip."""
+
+    def __init__(self, app, minimum_size: int, gzip_level: int, brotli_quality: int):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.brotli_quality = brotli_quality
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "text/event-stream" in Headers(scope=scope).get("accept", ""):
+            # Compressors buffer, which would hold live events back
+            await self.app(scope, receive, send)
+            return
+        if scope["type"] == "http" and brotli is not None:
+            accepted = Headers(scope=scope).get("accept-encoding", "")
+            if "br" in [encoding.split(";")[0].strip() for encoding in accepted.split(",")]:
+                await BrotliResponder(self.app, self.minimum_size, self.brotli_quality)(scope, receive, send)
+                return
+        await self.gzip(scope, receive, send)
+
+
+# Cache-Control for public GET routes, keyed by route template. Every other GET
+# carries admin data and is marked private and uncacheable. Availability is
+# refetched right after a 409, so caches must not serve it without asking.
+PUBLIC_CACHE_POLICIES = {
+    "/api/": f"public, max-age={PUBLIC_CACHE_MAX_AGE}",
+    "/api/consultations/availability": "public, no-cache",
+}
+
+
+class CachePolicyMiddleware:
+    """Add Cache-Control and Vary to GET responses that do not set their own."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                route = scope.get("route")
+                policy = PUBLIC_CACHE_POLICIES.get(route.path) if route else None
+                if "cache-control" not in headers:
+                    headers["Cache-Control"] = policy or "private, no-store"
+                vary = [value.strip().lower() for value in headers.get("vary", "").split(",")]
+                if "accept-encoding" not in vary:
+                    headers.add_vary_header("Accept-Encoding")
+                if policy is None and "authorization" in Headers(scope=scope):
+                    headers.add_vary_header("Authorization")
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
 
-app = FastAPI()
+# Created in the lifespan handler so importing the module never touches Mongo.
+client: Optional[AsyncIOMotorClient] = None
+db = None
+read_db = None
+readiness = {"ready": False}
+
+
+def mongo_client_options() -> dict:
+    options = {"tz_aware": True, "event_listeners": [mongo_metrics]}
+    for env_name, (option, cast) in MONGO_CLIENT_ENV_OPTIONS.items():
+        if os.environ.get(env_name):
+            options[option] = cast(os.environ[env_name])
+    return options
+
+
+def admin_read_preference():
+    modes = {
+        'primaryPreferred': PrimaryPreferred,
+        'secondary': Secondary,
+        'secondaryPreferred': SecondaryPreferred,
+        'nearest': Nearest,
+    }
+    if ADMIN_READ_PREFERENCE == 'primary':
+        return Primary()
+    if ADMIN_READ_PREFERENCE not in modes:
+        raise ValueError(f"Unknown ADMIN_READ_PREFERENCE: {ADMIN_READ_PREFERENCE}")
+    return modes[ADMIN_READ_PREFERENCE](max_staleness=ADMIN_READ_MAX_STALENESS)
+
+
+async def connect_mongo():
+    """Create the Motor client and wait until the server answers a ping."""
+    global client, db, read_db
+    client = AsyncIOMotorClient(mongo_url, **mongo_client_options())
+    db = client[os.environ['DB_NAME']]
+    read_db = client.get_database(os.environ['DB_NAME'], read_preference=admin_read_preference())
+    await client.admin.command('ping')
+
+
+def mark_admin_write(response: Response):
+    """Hand the client the time of its write; it sends it back so its next reads see the write."""
+    response.headers[ADMIN_WRITE_HEADER] = f"{time.time():.3f}"
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client says it made an admin write within READ_YOUR_WRITES_WINDOW."""
+    try:
+        written_at = float(request.headers.get(ADMIN_WRITE_HEADER, ''))
+    except ValueError:
+        return False
+    # abs() tolerates clock skew between workers; a forged value only pins its own reads
+    return abs(time.time() - written_at) < READ_YOUR_WRITES_WINDOW
+
+
+def admin_reads(request: Request):
+    """Database handle for heavy admin reads, pinned to the primary right after the client's own write."""
+    return db if wrote_recently(request) else read_db
+
+
 api_router = APIRouter(prefix="/api")
 
 security = HTTPBearer()
-ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'admin123')
+optional_security = HTTPBearer(auto_error=False)
+# Only seeds admin_credentials in an empty database; there is deliberately no default.
+ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD')
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key')
 JWT_ALGORITHM = "HS256"
+TOKEN_CACHE_SIZE = int(os.environ.get('TOKEN_CACHE_SIZE', '1024'))
+CREDENTIAL_CACHE_TTL = float(os.environ.get('CREDENTIAL_CACHE_TTL', '5'))
+VERIFY_QUERY_PLANS = os.environ.get('VERIFY_QUERY_PLANS', 'false').lower() == 'true'
+STATS_CACHE_TTL = float(os.environ.get('STATS_CACHE_TTL', '10'))
+SERVICES_CACHE_MAX_AGE = int(os.environ.get('SERVICES_CACHE_MAX_AGE', '300'))
+SERVICES_POLL_INTERVAL = float(os.environ.get('SERVICES_POLL_INTERVAL', '30'))
+INGEST_BUFFERED = os.environ.get('INGEST_BUFFERED', 'false').lower() == 'true'
+INGEST_BATCH_SIZE = int(os.environ.get('INGEST_BATCH_SIZE', '100'))
+INGEST_FLUSH_INTERVAL = float(os.environ.get('INGEST_FLUSH_INTERVAL', '0.5'))
+INGEST_MAX_PENDING = int(os.environ.get('INGEST_MAX_PENDING', '10000'))
+INGEST_PUT_TIMEOUT = float(os.environ.get('INGEST_PUT_TIMEOUT', '2'))
+INGEST_RETRY_BASE = float(os.environ.get('INGEST_RETRY_BASE', '0.5'))
+INGEST_RETRY_MAX = float(os.environ.get('INGEST_RETRY_MAX', '30'))
+# Leads carry updated_at from the app clock before they commit, and buffered
+# ones commit up to a flush interval later, so /admin/sync only hands out
+# changes older than this lag. Keep it above the longest expected commit delay;
+# a buffered batch retried for longer than this needs a full resync.
+SYNC_SAFETY_LAG = max(
+    float(os.environ.get('SYNC_SAFETY_LAG', '5')),
+    INGEST_FLUSH_INTERVAL + 1 if INGEST_BUFFERED else 0,
+)
+RATE_LIMIT_PER_MINUTE = float(os.environ.get('RATE_LIMIT_PER_MINUTE', '10'))
+RATE_LIMIT_BURST = int(os.environ.get('RATE_LIMIT_BURST', '5'))
+RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+# Number of reverse proxies in front of the app that append to X-Forwarded-For.
+# The default matches the single ingress the app is deployed behind; with 0 the
+# limiter keys on the socket peer and every visitor behind a proxy shares one
+# bucket. Set 0 only when uvicorn is exposed directly, where the header is spoofable.
+TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', '1'))
+DEDUP_WINDOW_SECONDS = float(os.environ.get('DEDUP_WINDOW_SECONDS', '600'))
+IDEMPOTENCY_TTL_SECONDS = int(os.environ.get('IDEMPOTENCY_TTL_SECONDS', '86400'))
+IDEMPOTENCY_CACHE_SIZE = int(os.environ.get('IDEMPOTENCY_CACHE_SIZE', '10000'))
+IDEMPOTENCY_LEASE_SECONDS = float(os.environ.get('IDEMPOTENCY_LEASE_SECONDS', '30'))
+CONSULTATION_SLOT_TIMES = os.environ.get('CONSULTATION_SLOT_TIMES', '09:00,10:00,11:00,14:00,15:00,16:00').split(',')
+CONSULTATION_BOOKING_DAYS = int(os.environ.get('CONSULTATION_BOOKING_DAYS', '90'))
+# Slot dates and times are wall-clock times in the business's zone (IANA name).
+BUSINESS_TIMEZONE = ZoneInfo(os.environ.get('BUSINESS_TIMEZONE', 'UTC'))
+# Moving a consultation into one of these statuses gives its slot back.
+SLOT_RELEASING_STATUSES = os.environ.get('SLOT_RELEASING_STATUSES', 'rejected,closed').split(',')
+EVENTS_BACKEND = os.environ.get('EVENTS_BACKEND', 'memory')
+EVENTS_QUEUE_SIZE = int(os.environ.get('EVENTS_QUEUE_SIZE', '100'))
+EVENTS_HEARTBEAT_SECONDS = float(os.environ.get('EVENTS_HEARTBEAT_SECONDS', '15'))
+# EventSource cannot send headers, so streams are opened with a short-lived
+# ticket in the query string instead of the admin token itself.
+EVENTS_TICKET_SECONDS = int(os.environ.get('EVENTS_TICKET_SECONDS', '60'))
+# Static bearer token for Prometheus scrapes of /api/metrics; admin tokens work too.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+# Upper bounds on client-supplied page sizes, so one request cannot ask for an
+# unbounded read or push a search $facet past the 16MB document limit.
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', '200'))
+MAX_SYNC_PAGE_SIZE = int(os.environ.get('MAX_SYNC_PAGE_SIZE', '1000'))
+ARCHIVE_ENABLED = os.environ.get('ARCHIVE_ENABLED', 'false').lower() == 'true'
+ARCHIVE_AFTER_DAYS = int(os.environ.get('ARCHIVE_AFTER_DAYS', '365'))
+ARCHIVE_STATUSES = os.environ.get('ARCHIVE_STATUSES', 'approved,rejected').split(',')
+ARCHIVE_TERMINAL_AFTER_DAYS = int(os.environ.get('ARCHIVE_TERMINAL_AFTER_DAYS', '30'))
+ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', '500'))
+ARCHIVE_INTERVAL = float(os.environ.get('ARCHIVE_INTERVAL', '3600'))
+NOTIFICATIONS_ENABLED = os.environ.get('NOTIFICATIONS_ENABLED', 'false').lower() == 'true'
+NOTIFY_BACKEND = os.environ.get('NOTIFY_BACKEND', 'log')
+NOTIFY_WEBHOOK_URL = os.environ.get('NOTIFY_WEBHOOK_URL')
+NOTIFY_SMTP_HOST = os.environ.get('NOTIFY_SMTP_HOST', 'localhost')
+NOTIFY_SMTP_PORT = int(os.environ.get('NOTIFY_SMTP_PORT', '587'))
+NOTIFY_SMTP_USER = os.environ.get('NOTIFY_SMTP_USER')
+NOTIFY_SMTP_PASSWORD = os.environ.get('NOTIFY_SMTP_PASSWORD')
+NOTIFY_SMTP_STARTTLS = os.environ.get('NOTIFY_SMTP_STARTTLS', 'true').lower() == 'true'
+NOTIFY_EMAIL_FROM = os.environ.get('NOTIFY_EMAIL_FROM', 'noreply@localhost')
+NOTIFY_EMAIL_TO = [address for address in os.environ.get('NOTIFY_EMAIL_TO', '').split(',') if address]
+NOTIFY_TIMEOUT = float(os.environ.get('NOTIFY_TIMEOUT', '10'))
+NOTIFY_BATCH_SIZE = int(os.environ.get('NOTIFY_BATCH_SIZE', '20'))
+NOTIFY_POLL_INTERVAL = float(os.environ.get('NOTIFY_POLL_INTERVAL', '5'))
+NOTIFY_MAX_ATTEMPTS = int(os.environ.get('NOTIFY_MAX_ATTEMPTS', '8'))
+NOTIFY_BACKOFF_BASE = float(os.environ.get('NOTIFY_BACKOFF_BASE', '5'))
+NOTIFY_BACKOFF_MAX = float(os.environ.get('NOTIFY_BACKOFF_MAX', '3600'))
+NOTIFY_LEASE_SECONDS = float(os.environ.get('NOTIFY_LEASE_SECONDS', '60'))
+NOTIFY_RETENTION_SECONDS = int(os.environ.get('NOTIFY_RETENTION_SECONDS', str(7 * 86400)))
+
+# Long-running tasks started on startup and cancelled on shutdown.
+background_tasks: List[asyncio.Task] = []
+
+
+# Indexes backing every query issued by api_router, created on startup.
+INDEXES = {
+    "quotes": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)], name="status_created_at"),
+        IndexModel([("updated_at", ASCENDING), ("id", ASCENDING)], name="updated_at_id"),
+        IndexModel([("service", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)], name="service_status_created_at"),
+        IndexModel([("budget", ASCENDING), ("created_at", DESCENDING)], name="budget_created_at"),
+        IndexModel([("company", ASCENDING), ("created_at", DESCENDING)], name="company_created_at"),
+        IndexModel(
+            [("description", TEXT), ("name", TEXT), ("company", TEXT)],
+            name="search_text",
+            weights={"description": 1, "name": 5, "company": 5},
+        ),
+    ],
+    "consultations": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)], name="status_created_at"),
+        IndexModel([("updated_at", ASCENDING), ("id", ASCENDING)], name="updated_at_id"),
+        IndexModel([("topic", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)], name="topic_status_created_at"),
+        IndexModel(
+            [("message", TEXT), ("name", TEXT), ("topic", TEXT)],
+            name="search_text",
+            weights={"message": 1, "name": 5, "topic": 2},
+        ),
+    ],
+    "services": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    ],
+    "consultation_slots": [
+        IndexModel([("consultation_id", ASCENDING)], name="consultation_id"),
+    ],
+    "rate_limits": [
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "idempotency_keys": [
+        IndexModel([("created_at", ASCENDING)], name="created_at_ttl", expireAfterSeconds=IDEMPOTENCY_TTL_SECONDS),
+    ],
+    "notification_outbox": [
+        IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)], name="status_next_attempt_at"),
+        IndexModel([("lease", ASCENDING)], name="lease"),
+        IndexModel([("sent_at", ASCENDING)], name="sent_at_ttl", expireAfterSeconds=NOTIFY_RETENTION_SECONDS),
+    ],
+}
+# Archives carry the same indexes, so include_archived reads get the same plans.
+INDEXES["quotes_archive"] = INDEXES["quotes"]
+INDEXES["consultations_archive"] = INDEXES["consultations"]
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Shape of a /admin/sync page after the first one (see fetch_changes)
+SYNC_HOT_QUERY = {
+    "updated_at": {"$lte": EPOCH},
+    "$or": [{"updated_at": {"$gt": EPOCH}}, {"updated_at": EPOCH, "id": {"$gt": ""}}],
+}
+# (collection, filter, sort) for the hot queries that must never fall back to a COLLSCAN.
+HOT_QUERIES = [
+    ("quotes", {"id": ""}, None),
+    ("quotes", {"status": "pending"}, None),
+    ("quotes", {}, [("created_at", -1), ("id", -1)]),
+    ("quotes", {"$or": [{"created_at": {"$lt": EPOCH}}, {"created_at": EPOCH, "id": {"$lt": ""}}]}, [("created_at", -1), ("id", -1)]),
+    ("quotes", SYNC_HOT_QUERY, [("updated_at", 1), ("id", 1)]),
+    ("consultations", {"id": ""}, None),
+    ("consultations", {"status": "pending"}, None),
+    ("consultations", {}, [("created_at", -1), ("id", -1)]),
+    ("consultations", {"$or": [{"created_at": {"$lt": EPOCH}}, {"created_at": EPOCH, "id": {"$lt": ""}}]}, [("created_at", -1), ("id", -1)]),
+    ("consultations", SYNC_HOT_QUERY, [("updated_at", 1), ("id", 1)]),
+    ("consultation_slots", {"_id": {"$gte": "", "$lt": "~"}}, None),
+    ("consultation_slots", {"consultation_id": {"$in": [""]}}, None),
+]
+
+
+INDEX_OPTIONS_CONFLICT = 85
+
+
+async def ensure_indexes():
+    for collection_name, indexes in INDEXES.items():
+        try:
+            await db[collection_name].create_indexes(indexes)
+        except OperationFailure as exc:
+            # A TTL taken from env changed since the index was built; createIndexes
+            # refuses to alter it, so apply the new value in place and retry
+            if exc.code != INDEX_OPTIONS_CONFLICT:
+                raise
+            await update_ttl_indexes(collection_name, indexes)
+            await db[collection_name].create_indexes(indexes)
+
+
+async def update_ttl_indexes(collection_name: str, indexes: List[IndexModel]):
+    """Set expireAfterSeconds on existing TTL indexes to the configured values with collMod."""
+    existing = await db[collection_name].index_information()
+    for index in indexes:
+        spec = index.document
+        if "expireAfterSeconds" not in spec or spec["name"] not in existing:
+            continue
+        if existing[spec["name"]].get("expireAfterSeconds") == spec["expireAfterSeconds"]:
+            continue
+        await db.command({
+            "collMod": collection_name,
+            "index": {"name": spec["name"], "expireAfterSeconds": spec["expireAfterSeconds"]},
+        })
+        logger.info("Changed %s.%s TTL to %ss", collection_name, spec["name"], spec["expireAfterSeconds"])
+
+
+def plan_stages(plan: dict):
+    """Yield every stage name in an explain() plan tree."""
+    yield plan.get('stage')
+    if 'inputStage' in plan:
+        yield from plan_stages(plan['inputStage'])
+    for child in plan.get('inputStages', []):
+        yield from plan_stages(child)
+
+
+async def verify_query_plans():
+    """Explain every hot query and raise if any of them scans a whole collection."""
+    offenders = []
+    for collection_name, query, sort in HOT_QUERIES:
+        find_cursor = db[collection_name].find(query)
+        if sort:
+            find_cursor = find_cursor.sort(sort)
+        explanation = await find_cursor.explain()
+        winning_plan = explanation['queryPlanner']['winningPlan']
+        winning_plan = winning_plan.get('queryPlan', winning_plan)
+        if 'COLLSCAN' in plan_stages(winning_plan):
+            offenders.append(f"{collection_name}: filter={query} sort={sort}")
+
+    if offenders:
+        raise RuntimeError("Hot queries fall back to COLLSCAN: " + "; ".join(offenders))
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of decoded JWT payloads, keyed by token digest and kept until exp."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self.key(token)
+        payload = self.entries.get(key)
+        if payload is None or payload['exp'] <= time.time():
+            self.entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, token: str, payload: dict):
+        self.entries[self.key(token)] = payload
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def revoke_all(self):
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+token_cache = VerifiedTokenCache(TOKEN_CACHE_SIZE)
+
+# The admin credential lives in Mongo so every worker shares it. Each worker
+# re-reads it at most every CREDENTIAL_CACHE_TTL seconds; its version is
+# embedded in issued tokens so a password change revokes them everywhere.
+credential_cache = {"value": None, "expires_at": 0.0}
+
+
+def hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+
+
+def check_password(password: str, password_hash: str) -> bool:
+    return bcrypt.checkpw(password.encode(), password_hash.encode())
+
+
+async def get_admin_credential() -> dict:
+    now = time.monotonic()
+    if credential_cache["value"] is not None and credential_cache["expires_at"] > now:
+        return credential_cache["value"]
+
+    credential = await db.admin_credentials.find_one({"_id": "admin"})
+    if credential is None:
+        if not ADMIN_PASSWORD:
+            # Never fall back to a well-known password on a fresh database
+            logger.error("No admin credential stored and ADMIN_PASSWORD is unset; run scripts/setup_admin.py")
+            raise HTTPException(status_code=503, detail="Admin account is not set up")
+        # First start against this database: seed from ADMIN_PASSWORD
+        credential = {
+            "_id": "admin",
+            "password_hash": await run_in_threadpool(hash_password, ADMIN_PASSWORD),
+            "version": 1,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        try:
+            await db.admin_credentials.insert_one(credential)
+        except DuplicateKeyError:
+            credential = await db.admin_credentials.find_one({"_id": "admin"})
+
+    credential_cache["value"] = credential
+    credential_cache["expires_at"] = now + CREDENTIAL_CACHE_TTL
+    return credential
 
 
 def create_access_token(data: dict):
@@ -37,15 +681,1002 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.InvalidTokenError:
+async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    return await authenticate(credentials.credentials)
+
+
+def create_stream_ticket(token: dict) -> str:
+    """A JWT that only opens /admin/events, valid for EVENTS_TICKET_SECONDS.
+
+    session_exp carries the admin token's expiry so the stream it opens is
+    closed when the session it was issued from ends.
+    """
+    expire = min(time.time() + EVENTS_TICKET_SECONDS, token['exp'])
+    return jwt.encode(
+        {"sub": token['sub'], "ver": token['ver'], "scope": "events", "exp": int(expire), "session_exp": token['exp']},
+        JWT_SECRET,
+        algorithm=JWT_ALGORITHM,
+    )
+
+
+async def verify_stream_token(
+    ticket: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+):
+    """Like verify_token, but also accepts a ?ticket= from /admin/events/ticket."""
+    if credentials is not None:
+        payload = await authenticate(credentials.credentials)
+        return {**payload, "session_exp": payload['exp']}
+    if ticket:
+        return await authenticate(ticket, scope="events")
+    raise HTTPException(status_code=403, detail="Not authenticated")
+
+
+async def verify_metrics_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Accept METRICS_TOKEN, so scrapers need no login, or an admin token."""
+    if METRICS_TOKEN and hmac.compare_digest(credentials.credentials.encode(), METRICS_TOKEN.encode()):
+        return {"sub": "metrics"}
+    return await authenticate(credentials.credentials)
+
+
+async def authenticate(token: str, scope: Optional[str] = None) -> dict:
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        except jwt.ExpiredSignatureError:
+            raise HTTPException(status_code=401, detail="Token has expired")
+        except jwt.InvalidTokenError:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        token_cache.put(token, payload)
+
+    if payload.get('scope') != scope:
         raise HTTPException(status_code=401, detail="Invalid token")
+    credential = await get_admin_credential()
+    if payload.get('ver') != credential['version']:
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    return payload
+
+
+class TrustedJSONResponse(JSONResponse):
+    """Serialize documents read from our own collections without re-validating them.
+
+    Returning this from an endpoint bypasses its response_model, which is kept
+    only for the OpenAPI schema.
+    """
+
+    def render(self, content) -> bytes:
+        return to_json(content)
+
+
+def model_response(model: BaseModel) -> Response:
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def encode_cursor(doc: dict) -> str:
+    """Build an opaque keyset cursor from the last document of a page."""
+    raw = json.dumps([doc['created_at'].isoformat(), doc['id']]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, doc_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), doc_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def archive_of(collection):
+    """The archive collection paired with a hot lead collection, on the same database handle."""
+    return collection.database[f"{collection.name}_archive"]
+
+
+async def fetch_page(collection, limit: int, skip: int = 0, cursor: Optional[str] = None, archive=None):
+    """Return one page of documents, newest first, plus the cursor for the next page.
+
+    With a cursor the page starts right after the (created_at, id) it encodes, so
+    every page costs the same index seek; without one the legacy skip/limit
+    paging is used. With an archive collection both are read in index order
+    and merged, so the page spans hot and archived leads; archived ones are
+    marked "archived": true since they are read-only.
+    """
+    query = {}
+    if cursor:
+        created_at, doc_id = decode_cursor(cursor)
+        query = {"$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": doc_id}},
+        ]}
+        skip = 0
+
+    sort = [("created_at", -1), ("id", -1)]
+    if archive is None:
+        docs = await collection.find(query, {"_id": 0}).sort(sort).skip(skip).limit(limit).to_list(limit)
+    else:
+        # Either side may supply the whole page, so read skip + limit from each
+        wanted = skip + limit
+        hot, cold = await asyncio.gather(
+            collection.find(query, {"_id": 0}).sort(sort).limit(wanted).to_list(wanted),
+            archive.find(query, {"_id": 0}).sort(sort).limit(wanted).to_list(wanted),
+        )
+        for doc in cold:
+            doc["archived"] = True
+        merged = heapq.merge(hot, cold, key=lambda doc: (doc["created_at"], doc["id"]), reverse=True)
+        docs = list(merged)[skip:wanted]
+    next_cursor = encode_cursor(docs[-1]) if docs and len(docs) == limit else None
+    return docs, next_cursor
+
+
+# Dashboard stats are cached in-process; writes bump the generation so a
+# computation that raced with a write is never stored.
+stats_cache = {"value": None, "expires_at": 0.0, "generation": 0}
+
+
+def invalidate_stats_cache():
+    stats_cache["value"] = None
+    stats_cache["generation"] += 1
+
+
+async def count_by_status(collection) -> dict:
+    counts = {}
+    async for row in collection.aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}]):
+        counts[row["_id"]] = row["count"]
+    return counts
+
+
+async def compute_stats(reads, include_archived: bool = False) -> dict:
+    """Lead totals by status; archived leads only count with include_archived."""
+    quotes_by_status, consultations_by_status = await asyncio.gather(
+        count_by_status(reads.quotes),
+        count_by_status(reads.consultations),
+    )
+    if include_archived:
+        for counts, collection in ((quotes_by_status, reads.quotes), (consultations_by_status, reads.consultations)):
+            for status, count in (await count_by_status(archive_of(collection))).items():
+                counts[status] = counts.get(status, 0) + count
+    return {
+        "total_quotes": sum(quotes_by_status.values()),
+        "pending_quotes": quotes_by_status.get("pending", 0),
+        "total_consultations": sum(consultations_by_status.values()),
+        "pending_consultations": consultations_by_status.get("pending", 0),
+        "quotes_by_status": quotes_by_status,
+        "consultations_by_status": consultations_by_status,
+    }
+
+
+async def get_cached_stats(request: Request) -> dict:
+    """Cached stats; a client that just wrote skips the cache and counts on the primary."""
+    now = time.monotonic()
+    fresh = wrote_recently(request)
+    if not fresh and stats_cache["value"] is not None and stats_cache["expires_at"] > now:
+        return stats_cache["value"]
+
+    generation = stats_cache["generation"]
+    stats = await compute_stats(db if fresh else read_db)
+    if generation == stats_cache["generation"]:
+        stats_cache["value"] = stats
+        stats_cache["expires_at"] = now + STATS_CACHE_TTL
+    return stats
+
+
+class WriteBehindQueue:
+    """Buffer public submissions and write them with batched insert_many calls.
+
+    A batch is flushed once it holds `batch_size` documents or `flush_interval`
+    seconds after its first document arrived. When `max_pending` documents are
+    waiting, producers block for up to `put_timeout` seconds and then get a 503.
+
+    Submitters already hold a 200, so a batch that fails transiently is retried
+    with backoff until it is stored; only documents Mongo rejects outright are
+    dropped, and logged.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_pending: int, put_timeout: float,
+                 retry_base: float = INGEST_RETRY_BASE, retry_max: float = INGEST_RETRY_MAX):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.closing = False
+
+    async def put(self, writes: list):
+        """Queue one submission's (collection_name, doc) writes, to be flushed together."""
+        if self.closing:
+            raise HTTPException(status_code=503, detail="Server is shutting down, please retry")
+        try:
+            await asyncio.wait_for(self.queue.put(writes), self.put_timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=503, detail="Too many pending submissions, please retry")
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self.flush(batch)
+            except Exception:
+                # A dead consumer would leave put() accepting submissions that are never written
+                logger.exception(
+                    "Dropping %d submissions after an unexpected flush error: %s",
+                    len(batch), [doc['id'] for writes in batch for _, doc in writes],
+                )
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def flush(self, batch: list):
+        docs_by_collection = {}
+        for writes in batch:
+            for collection_name, doc in writes:
+                docs_by_collection.setdefault(collection_name, []).append(doc)
+        # Every lead collection is written before the outbox, so a notification is
+        # never stored ahead of its lead, nor at all for a lead that was dropped
+        notifications = docs_by_collection.pop("notification_outbox", [])
+
+        try:
+            dropped = set()
+            for collection_name, docs in docs_by_collection.items():
+                dropped |= await self.write(collection_name, docs)
+            notifications = [doc for doc in notifications if doc["lead_id"] not in dropped]
+            if notifications:
+                await self.write("notification_outbox", notifications)
+        except asyncio.CancelledError:
+            logger.error(
+                "Cancelled with %d submissions unwritten: %s",
+                len(batch), [doc['id'] for writes in batch for _, doc in writes],
+            )
+            raise
+
+        invalidate_stats_cache()
+        for _ in batch:
+            self.queue.task_done()
+
+    async def write(self, collection_name: str, docs: list) -> set:
+        """insert_many until every document is stored or permanently rejected; return the rejected ids.
+
+        Errors outside PyMongoError, such as InvalidDocument or DocumentTooLarge,
+        fail the whole call without saying which document caused them, so the
+        batch is split and each document written on its own; the offending one
+        is logged and dropped.
+        """
+        attempt = 0
+        dropped = set()
+        while docs:
+            try:
+                await db[collection_name].insert_many(docs, ordered=False)
+                return dropped
+            except BulkWriteError as exc:
+                # Unordered: every document not named in writeErrors was inserted
+                rejected = {error["index"]: error for error in exc.details.get("writeErrors", [])}
+                for index, error in rejected.items():
+                    # Ids are random UUIDs, so a duplicate key means an earlier attempt stored it
+                    if error["code"] != 11000:
+                        logger.error("Dropping %s %s: %s", collection_name, docs[index]['id'], error.get("errmsg"))
+                        dropped.add(docs[index]['id'])
+                if not exc.details.get("writeConcernErrors"):
+                    return dropped
+                # Acknowledgement was lost; re-sending is safe because stored documents hit the _id index
+                docs = [doc for index, doc in enumerate(docs) if index not in rejected]
+            except PyMongoError:
+                logger.exception("Failed to flush %d %s, retrying", len(docs), collection_name)
+            except Exception:
+                if len(docs) == 1:
+                    logger.exception("Dropping %s %s that cannot be stored", collection_name, docs[0]['id'])
+                    return dropped | {docs[0]['id']}
+                for doc in docs:
+                    dropped |= await self.write(collection_name, [doc])
+                return dropped
+
+            attempt += 1
+            await asyncio.sleep(min(self.retry_max, self.retry_base * 2 ** (attempt - 1)))
+
+    async def drain(self, timeout: float = 10):
+        """Stop accepting submissions and wait for queued ones to be written."""
+        self.closing = True
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.error("Shut down with %d submissions still queued", self.queue.qsize())
+
+
+write_behind = WriteBehindQueue(
+    INGEST_BATCH_SIZE, INGEST_FLUSH_INTERVAL, INGEST_MAX_PENDING, INGEST_PUT_TIMEOUT
+) if INGEST_BUFFERED else None
+
+
+async def insert_submission(collection_name: str, doc: dict, notification: Optional[dict] = None):
+    """Store a public submission and its outbox notification, through the write-behind queue when enabled."""
+    writes = [(collection_name, doc)]
+    if notification is not None:
+        writes.append(("notification_outbox", notification))
+    if write_behind is not None:
+        await write_behind.put(writes)
+        return
+
+    await db[collection_name].insert_one(doc)
+    invalidate_stats_cache()
+    if notification is not None:
+        try:
+            await db.notification_outbox.insert_one(notification)
+        except PyMongoError:
+            # The lead is stored; a missed notification must not fail the submission
+            logger.exception("Failed to queue notification for %s %s", collection_name, doc['id'])
+
+
+class EventBroker:
+    """In-process pub/sub fanning lead events out to live dashboard streams.
+
+    Each subscriber gets a bounded queue. A subscriber that falls behind has its
+    backlog replaced by a single resync event telling it to refetch.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.subscribers = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, event: dict):
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync"})
+
+    def close(self):
+        """End every open stream."""
+        for queue in self.subscribers:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+
+event_broker = EventBroker(EVENTS_QUEUE_SIZE)
+
+# "memory" publishes from the request handlers of this worker; "changestream"
+# publishes what a Mongo change stream reports, so every worker sees every write.
+# Falls back to "memory" when change streams are unavailable.
+event_source = {"mode": EVENTS_BACKEND}
+
+
+def publish_event(event_type: str, collection_name: str, **fields):
+    if event_source["mode"] == "memory":
+        event_broker.publish({"type": event_type, "collection": collection_name, **fields})
+
+
+def change_to_event(change: dict) -> Optional[dict]:
+    collection_name = change["ns"]["coll"]
+    doc = change.get("fullDocument")
+    if doc is None:
+        return None
+    doc.pop("_id", None)
+    if change["operationType"] == "insert":
+        return {"type": "lead.created", "collection": collection_name, "item": doc}
+    if "status" in change.get("updateDescription", {}).get("updatedFields", {}):
+        return {
+            "type": "lead.status",
+            "collection": collection_name,
+            "id": doc["id"],
+            "status": doc["status"],
+            "updated_at": doc.get("updated_at"),
+        }
+    return None
+
+
+async def watch_lead_events():
+    """Publish lead inserts and status changes from a change stream across all workers."""
+    pipeline = [{"$match": {
+        "ns.coll": {"$in": ["quotes", "consultations"]},
+        "operationType": {"$in": ["insert", "update"]},
+    }}]
+    try:
+        async with db.watch(pipeline, full_document="updateLookup") as stream:
+            async for change in stream:
+                event = change_to_event(change)
+                if event is not None:
+                    event_broker.publish(event)
+    except PyMongoError:
+        logger.warning("Lead change stream unavailable, publishing events from this worker only")
+        event_source["mode"] = "memory"
+
+
+async def stream_events(queue: asyncio.Queue, auth: dict):
+    """Yield Server-Sent Events from a subscriber queue, with heartbeats to keep proxies from timing out.
+
+    The stream ends with a reauth event once the admin session behind auth
+    expires or the password changes; the client then asks for a new ticket.
+    """
+    try:
+        yield b"retry: 3000\n\n"
+        while True:
+            remaining = auth["session_exp"] - time.time()
+            credential = await get_admin_credential()
+            if remaining <= 0 or auth["ver"] != credential["version"]:
+                yield b"event: reauth\ndata: {}\n\n"
+                return
+            try:
+                event = await asyncio.wait_for(queue.get(), min(EVENTS_HEARTBEAT_SECONDS, remaining))
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if event is None:
+                return
+            yield b"event: " + event["type"].encode() + b"\ndata: " + to_json(event) + b"\n\n"
+    finally:
+        event_broker.unsubscribe(queue)
+
+
+class LogNotifier:
+    """Writes notifications to the log; the default, and a stand-in for local runs and tests."""
+
+    async def send(self, notifications: list):
+        for notification in notifications:
+            logger.info("New %s from %s: %s", notification["collection"], notification["lead"].get("email"), notification["lead_id"])
+
+
+class WebhookNotifier:
+    """POSTs each batch as one JSON document to a webhook URL."""
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+
+    async def send(self, notifications: list):
+        body = to_json({"notifications": [
+            {"collection": n["collection"], "lead": n["lead"], "created_at": n["created_at"]} for n in notifications
+        ]})
+
+        def post():
+            response = requests.post(
+                self.url, data=body, headers={"Content-Type": "application/json"}, timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+        await run_in_threadpool(post)
+
+
+class SmtpNotifier:
+    """Emails each batch to the staff recipients as one message."""
+
+    def __init__(self, host: str, port: int, sender: str, recipients: List[str],
+                 user: Optional[str], password: Optional[str], starttls: bool, timeout: float):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def message(self, notifications: list) -> EmailMessage:
+        message = EmailMessage()
+        message["Subject"] = f"{len(notifications)} new submission(s)"
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        lines = []
+        for notification in notifications:
+            lead = notification["lead"]
+            lines.append(f"[{notification['collection']}] {lead.get('name')} <{lead.get('email')}>")
+            for field, value in lead.items():
+                if field not in ("name", "email") and value is not None:
+                    lines.append(f"    {field}: {value}")
+            lines.append("")
+        message.set_content("\n".join(lines))
+        return message
+
+    async def send(self, notifications: list):
+        message = self.message(notifications)
+
+        def deliver():
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                if self.starttls:
+                    smtp.starttls()
+                if self.user:
+                    smtp.login(self.user, self.password)
+                smtp.send_message(message)
+
+        await run_in_threadpool(deliver)
+
+
+def build_notifier():
+    if NOTIFY_BACKEND == "webhook":
+        if not NOTIFY_WEBHOOK_URL:
+            raise RuntimeError("NOTIFY_BACKEND=webhook requires NOTIFY_WEBHOOK_URL")
+        return WebhookNotifier(NOTIFY_WEBHOOK_URL, NOTIFY_TIMEOUT)
+    if NOTIFY_BACKEND == "smtp":
+        if not NOTIFY_EMAIL_TO:
+            raise RuntimeError("NOTIFY_BACKEND=smtp requires NOTIFY_EMAIL_TO")
+        return SmtpNotifier(
+            NOTIFY_SMTP_HOST, NOTIFY_SMTP_PORT, NOTIFY_EMAIL_FROM, NOTIFY_EMAIL_TO,
+            NOTIFY_SMTP_USER, NOTIFY_SMTP_PASSWORD, NOTIFY_SMTP_STARTTLS, NOTIFY_TIMEOUT,
+        )
+    return LogNotifier()
+
+
+class NotificationOutbox:
+    """Delivers new-submission notifications from the notification_outbox collection.
+
+    The create path only stores an outbox document next to the lead, through
+    the same (possibly buffered) write path; this worker claims due documents
+    in batches, hands each batch to the notifier and retries failures with
+    exponential backoff. A claim pushes next_attempt_at forward by the lease,
+    so a batch held by a worker that dies is picked up again later, and
+    delivery is at least once.
+    """
+
+    def __init__(self, notifier, batch_size: int, poll_interval: float, max_attempts: int,
+                 backoff_base: float, backoff_max: float, lease_seconds: float):
+        self.notifier = notifier
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+        self.wake = asyncio.Event()
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    @staticmethod
+    def document(collection_name: str, lead: dict) -> dict:
+        now = datetime.now(timezone.utc)
+        return {
+            "id": str(uuid.uuid4()),
+            "collection": collection_name,
+            "lead_id": lead["id"],
+            "lead": lead,
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+        }
+
+    async def claim(self) -> list:
+        """Lease up to batch_size due documents in one update and return the ones this call won."""
+        now = datetime.now(timezone.utc)
+        due = {"status": "pending", "next_attempt_at": {"$lte": now}}
+        candidates = await db.notification_outbox.find(due, {"_id": 1}).sort(
+            "next_attempt_at", ASCENDING
+        ).limit(self.batch_size).to_list(self.batch_size)
+        if not candidates:
+            return []
+
+        # Another worker may lease some candidates first; the lease token tells ours apart
+        lease = str(uuid.uuid4())
+        await db.notification_outbox.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in candidates]}, **due},
+            {"$set": {"next_attempt_at": now + timedelta(seconds=self.lease_seconds), "lease": lease},
+             "$inc": {"attempts": 1}},
+        )
+        return await db.notification_outbox.find({"lease": lease}).to_list(self.batch_size)
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        # Jitter keeps retries from many workers from arriving in lockstep
+        return random.uniform(delay / 2, delay)
+
+    async def deliver(self, batch: list):
+        now = datetime.now(timezone.utc)
+        try:
+            await self.notifier.send(batch)
+        except Exception as exc:
+            logger.warning("Failed to deliver %d notifications: %s", len(batch), exc)
+            operations = []
+            for doc in batch:
+                if doc["attempts"] >= self.max_attempts:
+                    update = {"status": "failed", "last_error": str(exc)}
+                    self.failed += 1
+                else:
+                    update = {
+                        "next_attempt_at": now + timedelta(seconds=self.backoff(doc["attempts"])),
+                        "last_error": str(exc),
+                    }
+                    self.retried += 1
+                operations.append(UpdateOne({"_id": doc["_id"], "lease": doc["lease"]}, {"$set": update}))
+            await db.notification_outbox.bulk_write(operations, ordered=False)
+            return
+
+        # Matching on the lease leaves documents another worker re-claimed after it expired to that worker
+        await db.notification_outbox.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in batch]}, "lease": batch[0]["lease"]},
+            {"$set": {"status": "sent", "sent_at": now}, "$unset": {"last_error": ""}},
+        )
+        self.sent += len(batch)
+
+    async def run(self):
+        while True:
+            try:
+                batch = await self.claim()
+                if batch:
+                    await self.deliver(batch)
+                    continue
+            except PyMongoError:
+                logger.exception("Notification outbox unavailable")
+
+            self.wake.clear()
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+notification_outbox = NotificationOutbox(
+    build_notifier(), NOTIFY_BATCH_SIZE, NOTIFY_POLL_INTERVAL, NOTIFY_MAX_ATTEMPTS,
+    NOTIFY_BACKOFF_BASE, NOTIFY_BACKOFF_MAX, NOTIFY_LEASE_SECONDS,
+) if NOTIFICATIONS_ENABLED else None
+
+
+class TokenBucketLimiter:
+    """In-process token bucket per client key, holding at most max_keys buckets."""
+
+    def __init__(self, per_minute: float, burst: int, max_keys: int = 100000):
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+
+    async def allow(self, key: str) -> bool:
+        now = time.monotonic()
+        tokens, updated_at = self.buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+        allowed = tokens >= 1
+        self.buckets[key] = (tokens - 1 if allowed else tokens, now)
+        if len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+        return allowed
+
+
+class MongoRateLimiter:
+    """Fixed one-minute windows counted in Mongo so every worker shares the limit."""
+
+    def __init__(self, per_minute: float, burst: int):
+        self.limit = per_minute + burst
+
+    async def allow(self, key: str) -> bool:
+        window = int(time.time() // 60)
+        counter = await db.rate_limits.find_one_and_update(
+            {"_id": f"{key}:{window}"},
+            {
+                "$inc": {"count": 1},
+                "$setOnInsert": {"expires_at": datetime.fromtimestamp((window + 2) * 60, timezone.utc)},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["count"] <= self.limit
+
+
+class SubmissionDeduplicator:
+    """Remember submission fingerprints for a sliding window to reject repeats."""
+
+    def __init__(self, window_seconds: float):
+        self.window = window_seconds
+        self.seen = OrderedDict()
+
+    def check_and_remember(self, fingerprint: str) -> bool:
+        """Return True if the fingerprint is new, recording it either way."""
+        now = time.monotonic()
+        while self.seen:
+            oldest, seen_at = next(iter(self.seen.items()))
+            if now - seen_at < self.window:
+                break
+            self.seen.pop(oldest)
+
+        if fingerprint in self.seen:
+            return False
+        self.seen[fingerprint] = now
+        return True
+
+    def forget(self, fingerprint: str):
+        self.seen.pop(fingerprint, None)
+
+
+rate_limiter = (
+    MongoRateLimiter(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+    if RATE_LIMIT_BACKEND == 'mongo'
+    else TokenBucketLimiter(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+)
+deduplicator = SubmissionDeduplicator(DEDUP_WINDOW_SECONDS)
+
+
+def client_address(request: Request) -> str:
+    """The submitting client's address, as seen by the outermost trusted proxy.
+
+    Hops to the left of the ones our proxies appended are supplied by the
+    client and are never trusted.
+    """
+    forwarded_for = request.headers.get('x-forwarded-for')
+    if TRUSTED_PROXY_COUNT and forwarded_for:
+        hops = [hop.strip() for hop in forwarded_for.split(',') if hop.strip()]
+        if hops:
+            return hops[-min(TRUSTED_PROXY_COUNT, len(hops))]
+    return request.client.host if request.client else "unknown"
+
+
+def submission_fingerprint(collection_name: str, payload: BaseModel) -> str:
+    fields = {
+        key: value.strip().lower() if isinstance(value, str) else value
+        for key, value in payload.model_dump().items()
+    }
+    canonical = json.dumps([collection_name, fields], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def admit_submission(request: Request, collection_name: str, fingerprint: str):
+    """Rate-limit and de-duplicate a public submission before any other database work."""
+    if not await rate_limiter.allow(f"{collection_name}:{client_address(request)}"):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many submissions, please try again later",
+            headers={"Retry-After": "60"},
+        )
+
+    if not deduplicator.check_and_remember(fingerprint):
+        raise HTTPException(status_code=409, detail="This request was already submitted")
+
+
+class IdempotencyStore:
+    """Replay stored responses for retried requests that carry an Idempotency-Key.
+
+    Keys are claimed in the TTL-indexed idempotency_keys collection so every
+    worker agrees on them; completed responses are also kept in a hot LRU.
+    A claim records the id its lead will get and is leased for lease_seconds:
+    if the claiming request never completes, a retry after the lease either
+    replays the lead that did get stored or takes the claim over.
+    """
+
+    def __init__(self, cache_size: int, ttl_seconds: int, lease_seconds: float = IDEMPOTENCY_LEASE_SECONDS):
+        self.cache_size = cache_size
+        self.ttl = ttl_seconds
+        self.lease = timedelta(seconds=lease_seconds)
+        self.cache = OrderedDict()
+
+    @staticmethod
+    def replay(body: bytes) -> Response:
+        return Response(content=body, media_type="application/json", headers={"Idempotent-Replayed": "true"})
+
+    def remember(self, key: str, fingerprint: str, body: bytes):
+        self.cache[key] = (fingerprint, body, time.monotonic() + self.ttl)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def check_fingerprint(self, stored: str, fingerprint: str):
+        if stored != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request")
+
+    async def begin(self, key: str, fingerprint: str, collection_name: str, lead_id: str, model_cls) -> Optional[Response]:
+        """Claim the key for lead_id, or return the stored response if it was already completed."""
+        cached = self.cache.get(key)
+        if cached is not None and cached[2] > time.monotonic():
+            self.check_fingerprint(cached[0], fingerprint)
+            return self.replay(cached[1])
+
+        now = datetime.now(timezone.utc)
+        try:
+            await db.idempotency_keys.insert_one({
+                "_id": key,
+                "fingerprint": fingerprint,
+                "state": "in_progress",
+                "lead_id": lead_id,
+                "claimed_at": now,
+                "created_at": now,
+            })
+            return None
+        except DuplicateKeyError:
+            stored = await db.idempotency_keys.find_one({"_id": key})
+
+        if stored is None:
+            # Expired between the insert and the read; let the caller retry
+            raise HTTPException(status_code=409, detail="Idempotency-Key is being processed, please retry")
+        self.check_fingerprint(stored["fingerprint"], fingerprint)
+
+        if stored["state"] != "completed":
+            if stored["claimed_at"] > now - self.lease:
+                raise HTTPException(
+                    status_code=409, detail="A request with this Idempotency-Key is still being processed",
+                )
+            return await self.recover(key, fingerprint, stored, collection_name, lead_id, model_cls, now)
+
+        body = stored["response"].encode()
+        self.remember(key, fingerprint, body)
+        return self.replay(body)
+
+    async def recover(self, key, fingerprint, stored, collection_name, lead_id, model_cls, now) -> Optional[Response]:
+        """Settle a stale claim left by a request that died or failed to complete."""
+        lead = await db[collection_name].find_one({"id": stored.get("lead_id")}, {"_id": 0})
+        if lead is not None:
+            body = model_response(model_cls(**lead)).body
+            await self.complete(key, fingerprint, body)
+            return self.replay(body)
+
+        # Guard on the old claim so only one retry takes it over
+        result = await db.idempotency_keys.update_one(
+            {"_id": key, "state": "in_progress", "claimed_at": stored["claimed_at"]},
+            {"$set": {"lead_id": lead_id, "claimed_at": now}},
+        )
+        if result.modified_count == 0:
+            raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still being processed")
+        return None
+
+    async def complete(self, key: str, fingerprint: str, body: bytes):
+        self.remember(key, fingerprint, body)
+        try:
+            await db.idempotency_keys.update_one(
+                {"_id": key},
+                {"$set": {"state": "completed", "response": body.decode()}},
+            )
+        except PyMongoError:
+            # The lead is stored; once the lease lapses a retry finds it and replays it
+            logger.exception("Failed to record the response for Idempotency-Key %s", key)
+
+    async def abandon(self, key: str):
+        try:
+            await db.idempotency_keys.delete_one({"_id": key, "state": "in_progress"})
+        except PyMongoError:
+            # The claim's lease still lets a retry take it over
+            logger.exception("Failed to release Idempotency-Key %s", key)
+
+
+idempotency_store = IdempotencyStore(IDEMPOTENCY_CACHE_SIZE, IDEMPOTENCY_TTL_SECONDS)
+
+
+async def create_submission(
+    request: Request, collection_name: str, payload: BaseModel, model_cls, claim=None, release=None,
+) -> Response:
+    """Shared create path for public submissions.
+
+    Order matters: a retried request with a known Idempotency-Key is replayed
+    before rate limiting and de-duplication could reject it. claim, when given,
+    reserves whatever the submission books and raises if it cannot; release
+    undoes it when the submission is not stored.
+    """
+    fingerprint = submission_fingerprint(collection_name, payload)
+    lead_id = str(uuid.uuid4())
+    idempotency_key = request.headers.get('idempotency-key')
+    if idempotency_key is not None:
+        if not 0 < len(idempotency_key) <= 255:
+            raise HTTPException(status_code=400, detail="Idempotency-Key must be 1-255 characters")
+        idempotency_key = f"{collection_name}:{idempotency_key}"
+        replay = await idempotency_store.begin(idempotency_key, fingerprint, collection_name, lead_id, model_cls)
+        if replay is not None:
+            return replay
+
+    try:
+        await admit_submission(request, collection_name, fingerprint)
+        submission = model_cls(**payload.model_dump(), id=lead_id)
+        submission.updated_at = submission.created_at
+        try:
+            if claim is not None:
+                await claim(submission)
+            notification = None
+            if notification_outbox is not None:
+                notification = notification_outbox.document(collection_name, submission.model_dump(mode="json"))
+            try:
+                await insert_submission(collection_name, submission.model_dump(), notification)
+            except Exception:
+                if release is not None:
+                    await release(submission)
+                raise
+        except Exception:
+            deduplicator.forget(fingerprint)
+            raise
+    except Exception:
+        if idempotency_key is not None:
+            await idempotency_store.abandon(idempotency_key)
+        raise
+
+    if notification_outbox is not None:
+        notification_outbox.wake.set()
+    publish_event("lead.created", collection_name, item=submission.model_dump(mode="json"))
+    response = model_response(submission)
+    if idempotency_key is not None:
+        await idempotency_store.complete(idempotency_key, fingerprint, response.body)
+    return response
+
+
+def slot_key(date: str, time_of_day: str) -> str:
+    """_id of a consultation_slots document; ids sort by date, then time."""
+    return f"{date}|{time_of_day}"
+
+
+def business_now() -> datetime:
+    return datetime.now(BUSINESS_TIMEZONE)
+
+
+def normalize_slot(preferred_date: str, preferred_time: str) -> tuple:
+    """Validate a requested slot and return it as (YYYY-MM-DD, HH:MM)."""
+    try:
+        date = datetime.strptime(preferred_date.strip(), "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="preferred_date must be YYYY-MM-DD")
+
+    time_of_day = None
+    for time_format in ("%H:%M", "%I:%M %p"):
+        try:
+            time_of_day = datetime.strptime(preferred_time.strip().upper(), time_format).strftime("%H:%M")
+            break
+        except ValueError:
+            continue
+    if time_of_day not in CONSULTATION_SLOT_TIMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"preferred_time must be one of {', '.join(CONSULTATION_SLOT_TIMES)}",
+        )
+
+    now = business_now()
+    if not now.date() <= date <= now.date() + timedelta(days=CONSULTATION_BOOKING_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"preferred_date must be within the next {CONSULTATION_BOOKING_DAYS} days",
+        )
+    if date == now.date() and time_of_day <= now.strftime("%H:%M"):
+        raise HTTPException(status_code=400, detail="This time slot has already passed")
+    return date.isoformat(), time_of_day
+
+
+async def claim_consultation_slot(booking: BaseModel):
+    """Atomically reserve the booking's slot; the unique _id makes concurrent claims race safely."""
+    try:
+        await db.consultation_slots.insert_one({
+            "_id": slot_key(booking.preferred_date, booking.preferred_time),
+            "date": booking.preferred_date,
+            "time": booking.preferred_time,
+            "consultation_id": booking.id,
+            "claimed_at": datetime.now(timezone.utc),
+        })
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="This time slot is already booked")
+
+
+async def release_consultation_slot(booking: BaseModel):
+    await db.consultation_slots.delete_one({
+        "_id": slot_key(booking.preferred_date, booking.preferred_time),
+        "consultation_id": booking.id,
+    })
+
+
+async def release_consultation_slots(consultation_ids: List[str]):
+    """Free the slots held by consultations that no longer need them."""
+    await db.consultation_slots.delete_many({"consultation_id": {"$in": consultation_ids}})
+
+
+async def slot_availability(days: int) -> list:
+    """Free, still upcoming slots per day from today, found with one range scan over the _id index."""
+    now = business_now()
+    today = now.date()
+    past = {slot_key(today.isoformat(), t) for t in CONSULTATION_SLOT_TIMES if t <= now.strftime("%H:%M")}
+    dates = [(today + timedelta(days=offset)).isoformat() for offset in range(days)]
+    cursor = db.consultation_slots.find(
+        {"_id": {"$gte": slot_key(dates[0], ""), "$lt": slot_key((today + timedelta(days=days)).isoformat(), "")}},
+        {"_id": 1},
+    )
+    taken = {doc["_id"] async for doc in cursor} | past
+    return [
+        {"date": date, "available": [t for t in CONSULTATION_SLOT_TIMES if slot_key(date, t) not in taken]}
+        for date in dates
+    ]
 
 
 class Service(BaseModel):
@@ -71,15 +1702,18 @@ class QuoteRequest(BaseModel):
     description: str
     status: str = "pending"
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = None
 
 
+# Public submissions are capped well below Mongo's 16MB document limit, so one
+# oversized POST cannot fail a whole write-behind batch.
 class QuoteRequestCreate(BaseModel):
-    name: str
+    name: str = Field(max_length=200)
     email: EmailStr
-    company: Optional[str] = None
-    service: str
-    budget: Optional[str] = None
-    description: str
+    company: Optional[str] = Field(default=None, max_length=200)
+    service: str = Field(max_length=100)
+    budget: Optional[str] = Field(default=None, max_length=100)
+    description: str = Field(max_length=5000)
 
 
 class ConsultationBooking(BaseModel):
@@ -95,16 +1729,358 @@ class ConsultationBooking(BaseModel):
     message: Optional[str] = None
     status: str = "pending"
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = None
 
 
 class ConsultationBookingCreate(BaseModel):
-    name: str
+    name: str = Field(max_length=200)
     email: EmailStr
-    phone: Optional[str] = None
-    preferred_date: str
-    preferred_time: str
-    topic: str
-    message: Optional[str] = None
+    phone: Optional[str] = Field(default=None, max_length=50)
+    preferred_date: str = Field(max_length=20)
+    preferred_time: str = Field(max_length=20)
+    topic: str = Field(max_length=100)
+    message: Optional[str] = Field(default=None, max_length=5000)
+
+
+services_adapter = TypeAdapter(List[Service])
+
+# Pre-serialized services catalog served by GET /api/services.
+services_catalog = {"body": None, "etag": None}
+
+
+async def rebuild_services_catalog():
+    services = await db.services.find({}, {"_id": 0}).to_list(100)
+    body = services_adapter.dump_json(services_adapter.validate_python(services))
+    services_catalog["body"] = body
+    services_catalog["etag"] = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so W/"x" matches "x" (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')]
+    return '*' in candidates or etag.removeprefix('W/') in candidates
+
+
+async def watch_services_catalog():
+    """Keep this worker's catalog in sync with writes made by other workers.
+
+    Uses a change stream when Mongo runs as a replica set and falls back to
+    periodic rebuilds on a standalone server.
+    """
+    try:
+        async with db.services.watch() as stream:
+            async for _ in stream:
+                await rebuild_services_catalog()
+    except PyMongoError:
+        logger.info("Services change stream unavailable, polling every %ss", SERVICES_POLL_INTERVAL)
+
+    while True:
+        await asyncio.sleep(SERVICES_POLL_INTERVAL)
+        try:
+            await rebuild_services_catalog()
+        except PyMongoError:
+            logger.exception("Failed to refresh services catalog")
+
+
+class BulkStatusUpdate(BaseModel):
+    status: str
+    ids: Optional[List[str]] = Field(default=None, max_length=1000)
+    current_status: Optional[str] = None
+
+
+async def missing_lead(collection, item_id: str, label: str) -> HTTPException:
+    """404 for an unknown lead, 409 for one that has been archived and is read-only."""
+    if await archive_of(collection).count_documents({"id": item_id}, limit=1):
+        return HTTPException(status_code=409, detail=f"{label} is archived and read-only")
+    return HTTPException(status_code=404, detail=f"{label} not found")
+
+
+async def bulk_update_status(collection, update: BulkStatusUpdate, response: Response, release=None) -> dict:
+    """Apply one target status to a list of ids, or to every lead in current_status.
+
+    Only hot leads are updated: archived ids are reported under "archived"
+    rather than "not_found", and current_status never reaches the archive.
+    release, when given, is called with the ids of leads moved into one of
+    SLOT_RELEASING_STATUSES so whatever they booked can be freed.
+    """
+    if (update.ids is None) == (update.current_status is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or current_status")
+
+    not_found = []
+    archived = []
+    found = None
+    if update.ids is not None:
+        query = {"id": {"$in": update.ids}}
+        found = await collection.distinct("id", query)
+        found_ids = set(found)
+        missing = [item_id for item_id in update.ids if item_id not in found_ids]
+        if missing:
+            archived_ids = set(await archive_of(collection).distinct("id", {"id": {"$in": missing}}))
+            archived = [item_id for item_id in missing if item_id in archived_ids]
+            not_found = [item_id for item_id in missing if item_id not in archived_ids]
+    else:
+        query = {"status": update.current_status}
+
+    released = []
+    if release is not None and update.status in SLOT_RELEASING_STATUSES:
+        released = found if found is not None else await collection.distinct("id", query)
+
+    result = await collection.update_many(
+        query,
+        {"$set": {"status": update.status, "updated_at": datetime.now(timezone.utc)}},
+    )
+    mark_admin_write(response)
+    if released:
+        await release(released)
+    if result.modified_count:
+        invalidate_stats_cache()
+        publish_event(
+            "lead.bulk_status", collection.name,
+            status=update.status, ids=update.ids, current_status=update.current_status,
+        )
+
+    return {
+        "matched": result.matched_count,
+        "modified": result.modified_count,
+        "not_found": not_found,
+        "archived": archived,
+    }
+
+
+ARCHIVED_COLLECTIONS = ("quotes", "consultations")
+
+
+def archive_query(now: datetime) -> dict:
+    """Leads past the age threshold, or settled in a terminal status for a while."""
+    return {"$or": [
+        {"created_at": {"$lt": now - timedelta(days=ARCHIVE_AFTER_DAYS)}},
+        {
+            "status": {"$in": ARCHIVE_STATUSES},
+            "updated_at": {"$lt": now - timedelta(days=ARCHIVE_TERMINAL_AFTER_DAYS)},
+        },
+    ]}
+
+
+async def archive_leads(collection_name: str, batch_size: int) -> int:
+    """Move archivable leads into <collection>_archive in batches and return how many moved.
+
+    Each batch is upserted into the archive before it is deleted from the hot
+    collection, so an interrupted run never loses a lead and a re-run simply
+    finishes the move. A lead modified between the copy and the delete stays
+    hot and its archived copy is dropped.
+    """
+    hot = db[collection_name]
+    cold = db[f"{collection_name}_archive"]
+    query = archive_query(datetime.now(timezone.utc))
+    moved = 0
+
+    while True:
+        batch = await hot.find(query).limit(batch_size).to_list(batch_size)
+        if not batch:
+            break
+
+        await cold.bulk_write([ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in batch], ordered=False)
+        result = await hot.bulk_write(
+            [DeleteOne({"_id": doc["_id"], "updated_at": doc.get("updated_at")}) for doc in batch],
+            ordered=False,
+        )
+        if result.deleted_count < len(batch):
+            changed = await hot.distinct("_id", {"_id": {"$in": [doc["_id"] for doc in batch]}})
+            await cold.delete_many({"_id": {"$in": changed}})
+
+        moved += result.deleted_count
+        if result.deleted_count == 0:
+            break
+
+    if moved:
+        invalidate_stats_cache()
+    return moved
+
+
+async def run_archival():
+    while True:
+        for collection_name in ARCHIVED_COLLECTIONS:
+            try:
+                moved = await archive_leads(collection_name, ARCHIVE_BATCH_SIZE)
+                if moved:
+                    logger.info("Archived %d %s", moved, collection_name)
+            except PyMongoError:
+                logger.exception("Failed to archive %s", collection_name)
+        await asyncio.sleep(ARCHIVE_INTERVAL)
+
+
+QUOTE_EXPORT_FIELDS = ["id", "name", "email", "company", "service", "budget", "description", "status", "created_at"]
+CONSULTATION_EXPORT_FIELDS = [
+    "id", "name", "email", "phone", "preferred_date", "preferred_time", "topic", "message", "status", "created_at",
+]
+EXPORT_BATCH_SIZE = 500
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def export_query(status: Optional[str], created_from: Optional[datetime], created_to: Optional[datetime]) -> dict:
+    query = {}
+    if status:
+        query["status"] = status
+    created_range = created_at_range(created_from, created_to)
+    if created_range:
+        query["created_at"] = created_range
+    return query
+
+
+async def stream_export(collection, query: dict, fields: List[str], export_format: str):
+    """Yield the matching documents as NDJSON lines or CSV rows, one batch in memory at a time."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    if export_format == "csv":
+        writer.writeheader()
+        yield buffer.getvalue()
+
+    find_cursor = collection.find(query, {"_id": 0}).sort("created_at", 1).batch_size(EXPORT_BATCH_SIZE)
+    async for doc in find_cursor:
+        if export_format == "csv":
+            doc['created_at'] = doc['created_at'].isoformat()
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(doc)
+            yield buffer.getvalue()
+        else:
+            # to_json handles every datetime field, not just created_at
+            yield to_json(doc) + b"\n"
+
+
+def export_response(collection, name: str, fields: List[str], export_format: str, query: dict) -> StreamingResponse:
+    if export_format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="format must be ndjson or csv")
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_export(collection, query, fields, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+    )
+
+
+async def search_leads(
+    collection,
+    q: Optional[str],
+    filters: dict,
+    facet_fields: List[str],
+    limit: int,
+    skip: int,
+    archive=None,
+) -> dict:
+    """Run a text search plus filters and return one page with facet counts.
+
+    The page, the total and every facet come out of a single $facet aggregation,
+    so the match is evaluated once over the text or filter index. With an
+    archive collection its matches are folded in with $unionWith first and
+    marked "archived": true.
+    """
+    match = {field: value for field, value in filters.items() if value is not None}
+    stages = [{"$match": match}]
+    project = {"_id": 0}
+    if q:
+        match["$text"] = {"$search": q}
+        sort = {"score": {"$meta": "textScore"}, "created_at": -1}
+    else:
+        sort = {"created_at": -1, "id": -1}
+
+    if archive is not None:
+        branch = [{"$match": match}]
+        if q:
+            # Carry the text score as a field so hot and archived matches sort on the same key
+            score = {"$addFields": {"score": {"$meta": "textScore"}}}
+            stages.append(score)
+            branch.append(score)
+            sort = {"score": -1, "created_at": -1}
+            project["score"] = 0
+        branch.append({"$addFields": {"archived": True}})
+        stages.append({"$unionWith": {"coll": archive.name, "pipeline": branch}})
+
+    facets = {
+        "results": [{"$sort": sort}, {"$skip": skip}, {"$limit": limit}, {"$project": project}],
+        "total": [{"$count": "count"}],
+    }
+    for field in facet_fields:
+        facets[field] = [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}, {"$sort": {"count": -1}}]
+
+    rows = await collection.aggregate([*stages, {"$facet": facets}]).to_list(1)
+    row = rows[0] if rows else {}
+
+    return {
+        "results": row.get("results", []),
+        "total": row["total"][0]["count"] if row.get("total") else 0,
+        "facets": {
+            field: {str(bucket["_id"] or "unspecified"): bucket["count"] for bucket in row.get(field, [])}
+            for field in facet_fields
+        },
+    }
+
+
+def created_at_range(created_from: Optional[datetime], created_to: Optional[datetime]) -> Optional[dict]:
+    if not (created_from or created_to):
+        return None
+    created_range = {}
+    if created_from:
+        created_range["$gte"] = as_utc(created_from)
+    if created_to:
+        created_range["$lt"] = as_utc(created_to)
+    return created_range
+
+
+SYNC_COLLECTIONS = ("quotes", "consultations")
+
+
+def encode_sync_token(positions: dict) -> str:
+    raw = json.dumps({
+        name: [updated_at.isoformat(), doc_id] for name, (updated_at, doc_id) in positions.items()
+    }).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_sync_token(token: str) -> dict:
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(raw, dict):
+            raise ValueError("since token must be an object")
+        return {
+            name: (datetime.fromisoformat(raw[name][0]), raw[name][1])
+            for name in SYNC_COLLECTIONS if name in raw
+        }
+    except (ValueError, TypeError, KeyError, IndexError):
+        raise HTTPException(status_code=400, detail="Invalid since token")
+
+
+async def fetch_changes(collection, position: Optional[tuple], limit: int, until: datetime):
+    """Return documents changed after position and at or before until, oldest change first.
+
+    Changes are keyed on (updated_at, id); until keeps the window behind writes
+    that may still commit with an earlier updated_at.
+    """
+    query = {"updated_at": {"$lte": until}}
+    if position:
+        updated_at, doc_id = position
+        query["$or"] = [
+            {"updated_at": {"$gt": updated_at}},
+            {"updated_at": updated_at, "id": {"$gt": doc_id}},
+        ]
+    return await collection.find(query, {"_id": 0}).sort([("updated_at", 1), ("id", 1)]).limit(limit).to_list(limit)
+
+
+class AdminDashboard(BaseModel):
+    stats: dict
+    quotes: List[QuoteRequest]
+    consultations: List[ConsultationBooking]
+    quotes_next_cursor: Optional[str] = None
+    consultations_next_cursor: Optional[str] = None
 
 
 class AdminLogin(BaseModel):
@@ -128,171 +2104,451 @@ async def root():
 
 @api_router.post("/admin/login", response_model=TokenResponse)
 async def admin_login(login: AdminLogin):
-    if login.password != ADMIN_PASSWORD:
+    credential = await get_admin_credential()
+    if not await run_in_threadpool(check_password, login.password, credential['password_hash']):
         raise HTTPException(status_code=401, detail="Invalid password")
     
-    access_token = create_access_token({"sub": "admin"})
+    access_token = create_access_token({"sub": "admin", "ver": credential['version']})
     return TokenResponse(access_token=access_token)
 
 
 @api_router.post("/admin/change-password")
 async def change_admin_password(password_change: PasswordChange, token: dict = Depends(verify_token)):
-    global ADMIN_PASSWORD
-    
-    if password_change.current_password != ADMIN_PASSWORD:
+    credential = await get_admin_credential()
+    if not await run_in_threadpool(check_password, password_change.current_password, credential['password_hash']):
         raise HTTPException(status_code=401, detail="Current password is incorrect")
     
-    # Update password in environment file
-    env_path = ROOT_DIR / '.env'
-    with open(env_path, 'r') as f:
-        lines = f.readlines()
+    password_hash = await run_in_threadpool(hash_password, password_change.new_password)
+    result = await db.admin_credentials.update_one(
+        {"_id": "admin", "version": credential['version']},
+        {
+            "$set": {"password_hash": password_hash, "updated_at": datetime.now(timezone.utc)},
+            "$inc": {"version": 1},
+        }
+    )
     
-    with open(env_path, 'w') as f:
-        for line in lines:
-            if line.startswith('ADMIN_PASSWORD='):
-                f.write(f'ADMIN_PASSWORD="{password_change.new_password}"\n')
-            else:
-                f.write(line)
+    credential_cache["value"] = None
+    token_cache.revoke_all()
     
-    # Update global variable
-    ADMIN_PASSWORD = password_change.new_password
+    if result.matched_count == 0:
+        raise HTTPException(status_code=409, detail="Password was changed concurrently, please login again")
     
     return {"message": "Password changed successfully. Please login again with new password."}
 
 
+@api_router.get("/admin/dashboard", response_model=AdminDashboard)
+async def get_admin_dashboard(
+    request: Request,
+    quotes_limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    quotes_skip: int = Query(0, ge=0),
+    quotes_cursor: Optional[str] = None,
+    consultations_limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    consultations_skip: int = Query(0, ge=0),
+    consultations_cursor: Optional[str] = None,
+    token: dict = Depends(verify_token),
+):
+    reads = admin_reads(request)
+    stats, (quotes, quotes_next_cursor), (consultations, consultations_next_cursor) = await asyncio.gather(
+        get_cached_stats(request),
+        fetch_page(reads.quotes, quotes_limit, quotes_skip, quotes_cursor),
+        fetch_page(reads.consultations, consultations_limit, consultations_skip, consultations_cursor),
+    )
+
+    return TrustedJSONResponse({
+        "stats": stats,
+        "quotes": quotes,
+        "consultations": consultations,
+        "quotes_next_cursor": quotes_next_cursor,
+        "consultations_next_cursor": consultations_next_cursor,
+    })
+
+
+@api_router.get("/admin/sync")
+async def sync_changes(
+    request: Request,
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=MAX_SYNC_PAGE_SIZE),
+    token: dict = Depends(verify_token),
+):
+    """Return quotes and consultations created or updated after the since token.
+
+    Without a token every lead is returned, oldest change first. Clients keep
+    calling with the returned token while has_more is true, then store it for
+    the next sync. Changes newer than SYNC_SAFETY_LAG are held back until a
+    later sync, so a lead committed late cannot land behind the token.
+    """
+    positions = decode_sync_token(since) if since else {}
+    until = datetime.now(timezone.utc) - timedelta(seconds=SYNC_SAFETY_LAG)
+    reads = admin_reads(request)
+    changes = await asyncio.gather(*(
+        fetch_changes(reads[name], positions.get(name), limit, until) for name in SYNC_COLLECTIONS
+    ))
+
+    payload = {"has_more": False}
+    for name, docs in zip(SYNC_COLLECTIONS, changes):
+        payload[name] = docs
+        if docs:
+            positions[name] = (docs[-1]["updated_at"], docs[-1]["id"])
+        payload["has_more"] = payload["has_more"] or len(docs) == limit
+    payload["since"] = encode_sync_token(positions)
+
+    return TrustedJSONResponse(payload)
+
+
 @api_router.get("/services", response_model=List[Service])
-async def get_services():
-    services = await db.services.find({}, {"_id": 0}).to_list(100)
+async def get_services(request: Request):
+    if services_catalog["body"] is None:
+        await rebuild_services_catalog()
     
-    for service in services:
-        if isinstance(service.get('created_at'), str):
-            service['created_at'] = datetime.fromisoformat(service['created_at'])
+    headers = {
+        "ETag": services_catalog["etag"],
+        "Cache-Control": f"public, max-age={SERVICES_CACHE_MAX_AGE}",
+    }
+    if etag_matches(request.headers.get('if-none-match'), services_catalog["etag"]):
+        return Response(status_code=304, headers=headers)
     
-    return services
+    return Response(content=services_catalog["body"], media_type="application/json", headers=headers)
 
 
 @api_router.post("/services", response_model=Service)
 async def create_service(service: Service):
     doc = service.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    
     await db.services.insert_one(doc)
-    return service
+    await rebuild_services_catalog()
+    return model_response(service)
 
 
 @api_router.post("/quotes", response_model=QuoteRequest)
-async def create_quote_request(quote: QuoteRequestCreate):
-    quote_obj = QuoteRequest(**quote.model_dump())
-    
-    doc = quote_obj.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    
-    await db.quotes.insert_one(doc)
-    return quote_obj
+async def create_quote_request(quote: QuoteRequestCreate, request: Request):
+    return await create_submission(request, "quotes", quote, QuoteRequest)
 
 
 @api_router.get("/quotes", response_model=List[QuoteRequest])
-async def get_quote_requests(limit: int = 50, skip: int = 0, token: dict = Depends(verify_token)):
-    quotes = await db.quotes.find({}, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
-    
-    for quote in quotes:
-        if isinstance(quote.get('created_at'), str):
-            quote['created_at'] = datetime.fromisoformat(quote['created_at'])
+async def get_quote_requests(
+    request: Request,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    include_archived: bool = False,
+    token: dict = Depends(verify_token),
+):
+    collection = admin_reads(request).quotes
+    archive = archive_of(collection) if include_archived else None
+    quotes, next_cursor = await fetch_page(collection, limit, skip, cursor, archive)
+    headers = {'X-Next-Cursor': next_cursor} if next_cursor else None
     
-    return quotes
+    return TrustedJSONResponse(quotes, headers=headers)
 
 
 @api_router.get("/quotes/count")
-async def get_quotes_count(token: dict = Depends(verify_token)):
-    total = await db.quotes.count_documents({})
+async def get_quotes_count(request: Request, include_archived: bool = False, token: dict = Depends(verify_token)):
+    collection = admin_reads(request).quotes
+    total = await collection.count_documents({})
+    if include_archived:
+        total += await archive_of(collection).count_documents({})
     return {"total": total}
 
 
+@api_router.get("/quotes/export")
+async def export_quotes(
+    request: Request,
+    format: str = "ndjson",
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    token: dict = Depends(verify_token),
+):
+    query = export_query(status, created_from, created_to)
+    return export_response(admin_reads(request).quotes, "quotes", QUOTE_EXPORT_FIELDS, format, query)
+
+
+@api_router.get("/quotes/search")
+async def search_quotes(
+    request: Request,
+    q: Optional[str] = None,
+    service: Optional[str] = None,
+    status: Optional[str] = None,
+    budget: Optional[str] = None,
+    company: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0),
+    include_archived: bool = False,
+    token: dict = Depends(verify_token),
+):
+    filters = {
+        "service": service,
+        "status": status,
+        "budget": budget,
+        # Anchored prefix match so the company index can still be used
+        "company": {"$regex": f"^{re.escape(company)}"} if company else None,
+        "created_at": created_at_range(created_from, created_to),
+    }
+    collection = admin_reads(request).quotes
+    archive = archive_of(collection) if include_archived else None
+    result = await search_leads(collection, q, filters, ["service", "status", "budget"], limit, skip, archive)
+    return TrustedJSONResponse(result)
+
+
+@api_router.patch("/quotes/status")
+async def bulk_update_quote_status(update: BulkStatusUpdate, response: Response, token: dict = Depends(verify_token)):
+    return await bulk_update_status(db.quotes, update, response)
+
+
 @api_router.patch("/quotes/{quote_id}/status")
-async def update_quote_status(quote_id: str, status: str, token: dict = Depends(verify_token)):
+async def update_quote_status(quote_id: str, status: str, response: Response, token: dict = Depends(verify_token)):
+    updated_at = datetime.now(timezone.utc)
     result = await db.quotes.update_one(
         {"id": quote_id},
-        {"$set": {"status": status}}
+        {"$set": {"status": status, "updated_at": updated_at}}
     )
+    mark_admin_write(response)
     
     if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Quote not found")
+        raise await missing_lead(db.quotes, quote_id, "Quote")
     
+    invalidate_stats_cache()
+    publish_event("lead.status", "quotes", id=quote_id, status=status, updated_at=updated_at)
     return {"success": True}
 
 
 @api_router.post("/consultations", response_model=ConsultationBooking)
-async def create_consultation(consultation: ConsultationBookingCreate):
-    consultation_obj = ConsultationBooking(**consultation.model_dump())
-    
-    doc = consultation_obj.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    
-    await db.consultations.insert_one(doc)
-    return consultation_obj
+async def create_consultation(consultation: ConsultationBookingCreate, request: Request):
+    consultation.preferred_date, consultation.preferred_time = normalize_slot(
+        consultation.preferred_date, consultation.preferred_time
+    )
+    return await create_submission(
+        request, "consultations", consultation, ConsultationBooking,
+        claim=claim_consultation_slot, release=release_consultation_slot,
+    )
+
+
+@api_router.get("/consultations/availability")
+async def get_consultation_availability(days: int = 14):
+    if not 1 <= days <= CONSULTATION_BOOKING_DAYS:
+        raise HTTPException(status_code=400, detail=f"days must be between 1 and {CONSULTATION_BOOKING_DAYS}")
+    schedule = await slot_availability(days)
+    return {
+        "timezone": BUSINESS_TIMEZONE.key,
+        "today": schedule[0]["date"],
+        "slot_times": CONSULTATION_SLOT_TIMES,
+        "days": schedule,
+    }
 
 
 @api_router.get("/consultations", response_model=List[ConsultationBooking])
-async def get_consultations(limit: int = 50, skip: int = 0, token: dict = Depends(verify_token)):
-    consultations = await db.consultations.find({}, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+async def get_consultations(
+    request: Request,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    include_archived: bool = False,
+    token: dict = Depends(verify_token),
+):
+    collection = admin_reads(request).consultations
+    archive = archive_of(collection) if include_archived else None
+    consultations, next_cursor = await fetch_page(collection, limit, skip, cursor, archive)
+    headers = {'X-Next-Cursor': next_cursor} if next_cursor else None
     
-    for consultation in consultations:
-        if isinstance(consultation.get('created_at'), str):
-            consultation['created_at'] = datetime.fromisoformat(consultation['created_at'])
-    
-    return consultations
+    return TrustedJSONResponse(consultations, headers=headers)
 
 
 @api_router.get("/consultations/count")
-async def get_consultations_count(token: dict = Depends(verify_token)):
-    total = await db.consultations.count_documents({})
+async def get_consultations_count(request: Request, include_archived: bool = False, token: dict = Depends(verify_token)):
+    collection = admin_reads(request).consultations
+    total = await collection.count_documents({})
+    if include_archived:
+        total += await archive_of(collection).count_documents({})
     return {"total": total}
 
 
+@api_router.get("/consultations/export")
+async def export_consultations(
+    request: Request,
+    format: str = "ndjson",
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    token: dict = Depends(verify_token),
+):
+    query = export_query(status, created_from, created_to)
+    return export_response(admin_reads(request).consultations, "consultations", CONSULTATION_EXPORT_FIELDS, format, query)
+
+
+@api_router.get("/consultations/search")
+async def search_consultations(
+    request: Request,
+    q: Optional[str] = None,
+    topic: Optional[str] = None,
+    status: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0),
+    include_archived: bool = False,
+    token: dict = Depends(verify_token),
+):
+    filters = {
+        "topic": topic,
+        "status": status,
+        "created_at": created_at_range(created_from, created_to),
+    }
+    collection = admin_reads(request).consultations
+    archive = archive_of(collection) if include_archived else None
+    result = await search_leads(collection, q, filters, ["topic", "status"], limit, skip, archive)
+    return TrustedJSONResponse(result)
+
+
+@api_router.patch("/consultations/status")
+async def bulk_update_consultation_status(update: BulkStatusUpdate, response: Response, token: dict = Depends(verify_token)):
+    return await bulk_update_status(db.consultations, update, response, release=release_consultation_slots)
+
+
 @api_router.patch("/consultations/{consultation_id}/status")
-async def update_consultation_status(consultation_id: str, status: str, token: dict = Depends(verify_token)):
+async def update_consultation_status(consultation_id: str, status: str, response: Response, token: dict = Depends(verify_token)):
+    updated_at = datetime.now(timezone.utc)
     result = await db.consultations.update_one(
         {"id": consultation_id},
-        {"$set": {"status": status}}
+        {"$set": {"status": status, "updated_at": updated_at}}
     )
+    mark_admin_write(response)
     
     if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Consultation not found")
+        raise await missing_lead(db.consultations, consultation_id, "Consultation")
+    if status in SLOT_RELEASING_STATUSES:
+        await release_consultation_slots([consultation_id])
     
+    invalidate_stats_cache()
+    publish_event("lead.status", "consultations", id=consultation_id, status=status, updated_at=updated_at)
     return {"success": True}
 
 
+@api_router.post("/admin/events/ticket")
+async def issue_events_ticket(token: dict = Depends(verify_token)):
+    """Short-lived ticket for opening /admin/events, so the admin token never lands in a URL."""
+    return {"ticket": create_stream_ticket(token), "expires_in": EVENTS_TICKET_SECONDS}
+
+
+@api_router.get("/admin/events")
+async def lead_events(token: dict = Depends(verify_stream_token)):
+    """Server-Sent Events feed of new leads and status changes for live dashboards."""
+    return StreamingResponse(
+        stream_events(event_broker.subscribe(), token),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @api_router.get("/stats")
-async def get_stats(token: dict = Depends(verify_token)):
-    total_quotes = await db.quotes.count_documents({})
-    pending_quotes = await db.quotes.count_documents({"status": "pending"})
-    total_consultations = await db.consultations.count_documents({})
-    pending_consultations = await db.consultations.count_documents({"status": "pending"})
-    
-    return {
-        "total_quotes": total_quotes,
-        "pending_quotes": pending_quotes,
-        "total_consultations": total_consultations,
-        "pending_consultations": pending_consultations
-    }
+async def get_stats(request: Request, include_archived: bool = False, token: dict = Depends(verify_token)):
+    """Lead counts by status. Archived leads are left out unless include_archived is set."""
+    if include_archived:
+        return await compute_stats(admin_reads(request), include_archived=True)
+    return await get_cached_stats(request)
+
 
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(token: dict = Depends(verify_metrics_token)):
+    lines = request_latency.render() + mongo_command_latency.render()
+    token_stats = token_cache.stats()
+    lines += [
+        "# HELP token_cache_lookups_total Verified-token cache lookups.",
+        "# TYPE token_cache_lookups_total counter",
+        f'token_cache_lookups_total{{result="hit"}} {token_stats["hits"]}',
+        f'token_cache_lookups_total{{result="miss"}} {token_stats["misses"]}',
+        "# HELP token_cache_size Tokens held in the verified-token cache.",
+        "# TYPE token_cache_size gauge",
+        f"token_cache_size {token_stats['size']}",
+    ]
+    if write_behind is not None:
+        lines += [
+            "# HELP ingest_queue_depth Submissions waiting in the write-behind queue.",
+            "# TYPE ingest_queue_depth gauge",
+            f"ingest_queue_depth {write_behind.queue.qsize()}",
+        ]
+    if notification_outbox is not None:
+        lines += [
+            "# HELP notifications_total Notification delivery outcomes.",
+            "# TYPE notifications_total counter",
+            f'notifications_total{{result="sent"}} {notification_outbox.sent}',
+            f'notifications_total{{result="retried"}} {notification_outbox.retried}',
+            f'notifications_total{{result="failed"}} {notification_outbox.failed}',
+        ]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
+@api_router.get("/ready")
+async def readiness_probe():
+    if not readiness["ready"]:
+        raise HTTPException(status_code=503, detail="Starting up")
+    try:
+        await client.admin.command('ping')
+    except PyMongoError:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+    return {"ready": True}
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await connect_mongo()
+    await ensure_indexes()
+    if VERIFY_QUERY_PLANS:
+        await verify_query_plans()
+        logger.info("Query plan verification passed for %d hot queries", len(HOT_QUERIES))
+
+    background_tasks.append(asyncio.create_task(watch_services_catalog()))
+    if write_behind is not None:
+        background_tasks.append(asyncio.create_task(write_behind.run()))
+    if EVENTS_BACKEND == "changestream":
+        background_tasks.append(asyncio.create_task(watch_lead_events()))
+    if ARCHIVE_ENABLED:
+        background_tasks.append(asyncio.create_task(run_archival()))
+    if notification_outbox is not None:
+        background_tasks.append(asyncio.create_task(notification_outbox.run()))
+
+    readiness["ready"] = True
+    try:
+        yield
+    finally:
+        readiness["ready"] = False
+        event_broker.close()
+        if write_behind is not None:
+            await write_behind.drain()
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        client.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(api_router)
 
+if COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=COMPRESSION_MIN_SIZE,
+        gzip_level=GZIP_LEVEL,
+        brotli_quality=BROTLI_QUALITY,
+    )
+
+app.add_middleware(CachePolicyMiddleware)
+
+app.add_middleware(RequestMetricsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", ADMIN_WRITE_HEADER],
 )
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
@@ -4,9 +4,12 @@ Backend API Testing Suite for Development Services Platform
 Tests all FastAPI endpoints and validates functionality
 """
 
+import os
 import requests
 import sys
 import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Any
 
@@ -112,13 +115,14 @@ class DevServicesAPITester:
 
     def test_create_quote_request(self):
         """Test creating a quote request"""
+        # A unique description keeps repeat runs clear of the duplicate-submission window
         quote_data = {
             "name": "John Doe",
             "email": "john@example.com",
             "company": "Test Company",
             "service": "development",
             "budget": "10k-25k",
-            "description": "Need a full-stack web application for my business"
+            "description": f"Need a full-stack web application for my business (test {uuid.uuid4().hex[:8]})"
         }
         return self.run_test("Create Quote Request", "POST", "quotes", 200, quote_data)
 
@@ -126,19 +130,95 @@ class DevServicesAPITester:
         """Test retrieving quote requests"""
         return self.run_test("Get Quote Requests", "GET", "quotes")
 
+    def find_free_slot(self):
+        """Return (date, time) of the first free consultation slot, or None"""
+        response = requests.get(f"{self.api_base}/consultations/availability", params={'days': 30}, timeout=10)
+        if response.status_code != 200:
+            return None
+        for day in response.json()['days']:
+            if day['available']:
+                return day['date'], day['available'][0]
+        return None
+
     def test_create_consultation(self):
         """Test creating a consultation booking"""
+        slot = self.find_free_slot()
+        if slot is None:
+            print("   ⚠️  SKIPPED - No free consultation slot available")
+            return False, {}
+
         consultation_data = {
             "name": "Jane Smith",
             "email": "jane@example.com",
             "phone": "+1234567890",
-            "preferred_date": "2024-12-20",
-            "preferred_time": "14:00",
+            "preferred_date": slot[0],
+            "preferred_time": slot[1],
             "topic": "development",
             "message": "Would like to discuss project requirements"
         }
         return self.run_test("Create Consultation", "POST", "consultations", 200, consultation_data)
 
+    def test_get_consultation_availability(self):
+        """Test retrieving free consultation slots"""
+        return self.run_test("Get Consultation Availability", "GET", "consultations/availability", 200, params={'days': '7'})
+
+    def test_concurrent_slot_booking(self, attempts: int = 3):
+        """Hammer one free slot concurrently; exactly one booking may succeed
+
+        attempts stays within the per-visitor burst left after the earlier
+        submissions, so a 429 here means visitors are not told apart, which
+        usually means TRUSTED_PROXY_COUNT does not match the proxies in front.
+        """
+        self.tests_run += 1
+        print(f"\n🔍 Test {self.tests_run}: Concurrent Slot Booking ({attempts} requests)")
+
+        slot = self.find_free_slot()
+        if slot is None:
+            print("   ⚠️  SKIPPED - No free consultation slot available")
+            return False
+
+        def book(attempt):
+            response = requests.post(
+                f"{self.api_base}/consultations",
+                json={
+                    "name": f"Race {attempt}",
+                    "email": f"race{attempt}@example.com",
+                    "preferred_date": slot[0],
+                    "preferred_time": slot[1],
+                    "topic": "development",
+                    "message": f"Concurrent booking attempt {attempt}",
+                },
+                timeout=10,
+            )
+            return response.status_code
+
+        try:
+            with ThreadPoolExecutor(max_workers=attempts) as pool:
+                statuses = list(pool.map(book, range(attempts)))
+        except requests.exceptions.RequestException as e:
+            statuses = []
+            print(f"   ❌ FAILED - Network Error: {str(e)}")
+
+        success = statuses.count(200) == 1 and statuses.count(409) == attempts - 1
+        if success:
+            self.tests_passed += 1
+            print(f"   ✅ PASSED - 1 booking, {statuses.count(409)} conflicts for {slot[0]} {slot[1]}")
+        elif 429 in statuses:
+            print(f"   ❌ FAILED - Rate limited ({sorted(statuses)}); check TRUSTED_PROXY_COUNT")
+        elif statuses:
+            print(f"   ❌ FAILED - Expected 1×200 and the rest 409, got {sorted(statuses)}")
+
+        self.test_results.append({
+            'test_name': 'Concurrent Slot Booking',
+            'method': 'POST',
+            'endpoint': 'consultations',
+            'expected_status': 200,
+            'actual_status': sorted(statuses),
+            'success': success,
+            'response_preview': "OK" if success else f"Statuses: {sorted(statuses)}"
+        })
+        return success
+
     def test_get_consultations(self):
         """Test retrieving consultations"""
         return self.run_test("Get Consultations", "GET", "consultations")
@@ -205,8 +285,10 @@ class DevServicesAPITester:
             self.test_update_quote_status()  # Will try to create one internally
         
         # Test consultation functionality
+        self.test_get_consultation_availability()
         consultation_success, consultation_response = self.test_create_consultation()
         self.test_get_consultations()
+        self.test_concurrent_slot_booking()
         
         if consultation_success and consultation_response.get('id'):
             self.test_update_consultation_status(consultation_response['id'])
@@ -241,7 +323,9 @@ class DevServicesAPITester:
 
 def main():
     """Main test execution function"""
-    tester = DevServicesAPITester()
+    # Point at a local server with e.g. BACKEND_URL=http://localhost:8001
+    base_url = os.environ.get('BACKEND_URL')
+    tester = DevServicesAPITester(base_url) if base_url else DevServicesAPITester()
     
     try:
         success = tester.run_comprehensive_tests()
@@ -33,15 +33,107 @@ const AdminDashboard = () => {
     fetchData();
   }, [quotesPage, consultationsPage]);
 
+  // Live updates: apply pushed changes to the loaded page and refresh only the
+  // stats; a full refetch is reserved for resync
+  useEffect(() => {
+    const token = localStorage.getItem('admin_token');
+    if (!token) return;
+
+    let events = null;
+    let closed = false;
+    let statsTimer = null;
+    let reconnectTimer = null;
+
+    const scheduleStatsRefresh = () => {
+      clearTimeout(statsTimer);
+      statsTimer = setTimeout(fetchStats, 1000);
+    };
+    const setItemsFor = (collection) => (collection === 'quotes' ? setQuotes : setConsultations);
+
+    const reconnect = () => {
+      if (events) events.close();
+      clearTimeout(reconnectTimer);
+      if (!closed) reconnectTimer = setTimeout(connect, 3000);
+    };
+
+    // The admin token stays out of the URL: the stream is opened with a
+    // short-lived ticket, and a new one is fetched whenever it reconnects
+    const connect = async () => {
+      let ticket;
+      try {
+        const response = await axios.post('/api/admin/events/ticket', {}, getAuthHeaders());
+        ticket = response.data.ticket;
+      } catch (error) {
+        if (error.response?.status === 401) {
+          toast.error('Session expired. Please login again.');
+          localStorage.removeItem('admin_token');
+          navigate('/admin/login');
+        } else {
+          reconnect();
+        }
+        return;
+      }
+      if (closed) return;
+
+      events = new EventSource(`/api/admin/events?ticket=${encodeURIComponent(ticket)}`);
+      events.addEventListener('lead.status', (event) => {
+        const { collection, id, status } = JSON.parse(event.data);
+        setItemsFor(collection)((items) => items.map((item) => (item.id === id ? { ...item, status } : item)));
+        scheduleStatsRefresh();
+      });
+      events.addEventListener('lead.created', (event) => {
+        const { collection, item } = JSON.parse(event.data);
+        const onFirstPage = collection === 'quotes' ? quotesPage === 0 : consultationsPage === 0;
+        if (onFirstPage) {
+          setItemsFor(collection)((items) => (
+            items.some((existing) => existing.id === item.id) ? items : [item, ...items].slice(0, itemsPerPage)
+          ));
+        }
+        scheduleStatsRefresh();
+      });
+      events.addEventListener('lead.bulk_status', (event) => {
+        const { collection, status, ids, current_status: currentStatus } = JSON.parse(event.data);
+        const matches = ids ? (item) => ids.includes(item.id) : (item) => item.status === currentStatus;
+        setItemsFor(collection)((items) => items.map((item) => (matches(item) ? { ...item, status } : item)));
+        scheduleStatsRefresh();
+      });
+      events.addEventListener('resync', () => fetchData());
+      // Sent when the session behind the stream ends; a fresh ticket tells us whether it is still valid
+      events.addEventListener('reauth', reconnect);
+      events.onerror = () => {
+        // The browser retries dropped streams itself, but not one refused with a stale ticket
+        if (events.readyState === EventSource.CLOSED) reconnect();
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(statsTimer);
+      clearTimeout(reconnectTimer);
+      if (events) events.close();
+    };
+  }, [quotesPage, consultationsPage]);
+
   const getAuthHeaders = () => {
     const token = localStorage.getItem('admin_token');
+    const writtenAt = localStorage.getItem('admin_write_at');
     return {
       headers: {
-        Authorization: `Bearer ${token}`
+        Authorization: `Bearer ${token}`,
+        // Lets the server route reads right after our own write to the primary
+        ...(writtenAt && { 'X-Admin-Write-At': writtenAt })
       }
     };
   };
 
+  const rememberWrite = (response) => {
+    const writtenAt = response.headers['x-admin-write-at'];
+    if (writtenAt) {
+      localStorage.setItem('admin_write_at', writtenAt);
+    }
+  };
+
   const handleLogout = () => {
     localStorage.removeItem('admin_token');
     toast.success('Logged out successfully');
@@ -56,20 +148,22 @@ const AdminDashboard = () => {
   const fetchData = async () => {
     setLoading(true);
     try {
-      const authHeaders = getAuthHeaders();
-      const [statsRes, quotesRes, consultationsRes, quotesCountRes, consultationsCountRes] = await Promise.all([
-        axios.get(`/api/stats`, authHeaders),
-        axios.get(`/api/quotes?limit=${itemsPerPage}&skip=${quotesPage * itemsPerPage}`, authHeaders),
-        axios.get(`/api/consultations?limit=${itemsPerPage}&skip=${consultationsPage * itemsPerPage}`, authHeaders),
-        axios.get(`/api/quotes/count`, authHeaders),
-        axios.get(`/api/consultations/count`, authHeaders)
-      ]);
+      const response = await axios.get(`/api/admin/dashboard`, {
+        ...getAuthHeaders(),
+        params: {
+          quotes_limit: itemsPerPage,
+          quotes_skip: quotesPage * itemsPerPage,
+          consultations_limit: itemsPerPage,
+          consultations_skip: consultationsPage * itemsPerPage
+        }
+      });
+      const { stats, quotes, consultations } = response.data;
       
-      setStats(statsRes.data);
-      setQuotes(quotesRes.data);
-      setConsultations(consultationsRes.data);
-      setQuotesTotal(quotesCountRes.data.total);
-      setConsultationsTotal(consultationsCountRes.data.total);
+      setStats(stats);
+      setQuotes(quotes);
+      setConsultations(consultations);
+      setQuotesTotal(stats.total_quotes);
+      setConsultationsTotal(stats.total_consultations);
     } catch (error) {
       console.error('Error fetching data:', error);
       if (error.response?.status === 401) {
@@ -84,9 +178,20 @@ const AdminDashboard = () => {
     }
   };
 
+  const fetchStats = async () => {
+    try {
+      const response = await axios.get('/api/stats', getAuthHeaders());
+      setStats(response.data);
+      setQuotesTotal(response.data.total_quotes);
+      setConsultationsTotal(response.data.total_consultations);
+    } catch (error) {
+      console.error('Error fetching stats:', error);
+    }
+  };
+
   const updateQuoteStatus = async (quoteId, status) => {
     try {
-      await axios.patch(`/api/quotes/${quoteId}/status?status=${status}`, {}, getAuthHeaders());
+      rememberWrite(await axios.patch(`/api/quotes/${quoteId}/status?status=${status}`, {}, getAuthHeaders()));
       toast.success('Quote status updated');
       fetchData();
     } catch (error) {
@@ -102,7 +207,7 @@ const AdminDashboard = () => {
 
   const updateConsultationStatus = async (consultationId, status) => {
     try {
-      await axios.patch(`/api/consultations/${consultationId}/status?status=${status}`, {}, getAuthHeaders());
+      rememberWrite(await axios.patch(`/api/consultations/${consultationId}/status?status=${status}`, {}, getAuthHeaders()));
       toast.success('Consultation status updated');
       fetchData();
     } catch (error) {
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { ArrowLeft, Calendar } from 'lucide-react';
 import axios from 'axios';
@@ -16,6 +16,29 @@ const ConsultationBooking = () => {
     topic: '',
     message: ''
   });
+  const [availability, setAvailability] = useState({});
+  // Until the server answers, fall back to the visitor's local date
+  const [today, setToday] = useState(new Date().toLocaleDateString('en-CA'));
+
+  const fetchAvailability = async () => {
+    try {
+      const response = await axios.get(`/api/consultations/availability`, { params: { days: 60 } });
+      setAvailability(Object.fromEntries(response.data.days.map((day) => [day.date, day.available])));
+      setToday(response.data.today);
+    } catch (error) {
+      // Without availability every time stays selectable; the server still rejects taken slots
+      console.error('Error fetching availability:', error);
+    }
+  };
+
+  useEffect(() => {
+    fetchAvailability();
+  }, []);
+
+  const isTaken = (time) => {
+    const available = availability[formData.preferred_date];
+    return available !== undefined && !available.includes(time);
+  };
 
   const handleChange = (e) => {
     setFormData({
@@ -36,7 +59,12 @@ const ConsultationBooking = () => {
       }, 1500);
     } catch (error) {
       console.error('Error booking consultation:', error);
-      toast.error('Failed to book consultation. Please try again.');
+      if (error.response?.status === 409) {
+        toast.error('That time slot was just booked. Please pick another time.');
+        fetchAvailability();
+      } else {
+        toast.error('Failed to book consultation. Please try again.');
+      }
     } finally {
       setLoading(false);
     }
@@ -126,7 +154,7 @@ const ConsultationBooking = () => {
                   value={formData.preferred_date}
                   onChange={handleChange}
                   required
-                  min={new Date().toISOString().split('T')[0]}
+                  min={today}
                   className="input-field w-full px-4 py-3 rounded-lg text-white"
                   data-testid="date-input"
                 />
@@ -144,12 +172,12 @@ const ConsultationBooking = () => {
                   data-testid="time-select"
                 >
                   <option value="">Select time</option>
-                  <option value="09:00">09:00 AM</option>
-                  <option value="10:00">10:00 AM</option>
-                  <option value="11:00">11:00 AM</option>
-                  <option value="14:00">02:00 PM</option>
-                  <option value="15:00">03:00 PM</option>
-                  <option value="16:00">04:00 PM</option>
+                  <option value="09:00" disabled={isTaken('09:00')}>09:00 AM</option>
+                  <option value="10:00" disabled={isTaken('10:00')}>10:00 AM</option>
+                  <option value="11:00" disabled={isTaken('11:00')}>11:00 AM</option>
+                  <option value="14:00" disabled={isTaken('14:00')}>02:00 PM</option>
+                  <option value="15:00" disabled={isTaken('15:00')}>03:00 PM</option>
+                  <option value="16:00" disabled={isTaken('16:00')}>04:00 PM</option>
                 </select>
               </div>
             </div>
@@ -180,6 +208,7 @@ const ConsultationBooking = () => {
               </label>
               <textarea
                 name="message"
+                maxLength={5000}
                 value={formData.message}
                 onChange={handleChange}
                 rows={4}
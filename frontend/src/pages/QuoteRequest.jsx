@@ -161,6 +161,7 @@ const QuoteRequest = () => {
               </label>
               <textarea
                 name="description"
+                maxLength={5000}
                 value={formData.description}
                 onChange={handleChange}
                 required
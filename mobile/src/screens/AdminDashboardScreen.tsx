@@ -11,7 +11,7 @@ import {
 import { useNavigation } from '@react-navigation/native';
 import GlassCard from '../components/GlassCard';
 import GlassButton from '../components/GlassButton';
-import { quotesAPI, consultationsAPI, statsAPI, authAPI } from '../services/api';
+import { quotesAPI, consultationsAPI, statsAPI, authAPI, syncAPI } from '../services/api';
 
 const AdminDashboardScreen = () => {
   const navigation = useNavigation();
@@ -29,14 +29,11 @@ const AdminDashboardScreen = () => {
 
   const fetchData = async () => {
     try {
-      const [statsData, quotesData, consultationsData] = await Promise.all([
-        statsAPI.get(),
-        quotesAPI.getAll(50, 0),
-        consultationsAPI.getAll(50, 0),
-      ]);
+      // Only leads changed since the last pull come over the wire
+      const [statsData, leads] = await Promise.all([statsAPI.get(), syncAPI.pull()]);
       setStats(statsData);
-      setQuotes(quotesData);
-      setConsultations(consultationsData);
+      setQuotes(leads.quotes);
+      setConsultations(leads.consultations);
     } catch (error) {
       Alert.alert('Error', 'Failed to load dashboard data');
     } finally {
@@ -58,8 +55,10 @@ const AdminDashboardScreen = () => {
     try {
       if (type === 'quote') {
         await quotesAPI.updateStatus(id, status);
+        await syncAPI.patch('quotes', id, { status });
       } else {
         await consultationsAPI.updateStatus(id, status);
+        await syncAPI.patch('consultations', id, { status });
       }
       Alert.alert('Success', 'Status updated successfully');
       fetchData();
@@ -12,15 +12,28 @@ const api = axios.create({
   },
 });
 
-// Add token to requests
+// Add token to requests, plus the time of our last admin write so reads
+// right after it are served from the primary
 api.interceptors.request.use(async (config) => {
   const token = await AsyncStorage.getItem('admin_token');
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
+  const writtenAt = await AsyncStorage.getItem('admin_write_at');
+  if (writtenAt) {
+    config.headers['X-Admin-Write-At'] = writtenAt;
+  }
   return config;
 });
 
+api.interceptors.response.use(async (response) => {
+  const writtenAt = response.headers['x-admin-write-at'];
+  if (writtenAt) {
+    await AsyncStorage.setItem('admin_write_at', writtenAt);
+  }
+  return response;
+});
+
 export const authAPI = {
   login: async (password: string) => {
     const response = await api.post('/admin/login', { password });
@@ -31,6 +44,7 @@ export const authAPI = {
   },
   logout: async () => {
     await AsyncStorage.removeItem('admin_token');
+    await syncAPI.reset();
   },
   isAuthenticated: async () => {
     const token = await AsyncStorage.getItem('admin_token');
@@ -39,8 +53,10 @@ export const authAPI = {
 };
 
 export const quotesAPI = {
-  create: async (data: any) => {
-    const response = await api.post('/quotes', data);
+  create: async (data: any, idempotencyKey?: string) => {
+    // Reuse the same key when retrying so the server replays the first response
+    const headers = idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined;
+    const response = await api.post('/quotes', data, { headers });
     return response.data;
   },
   getAll: async (limit = 50, skip = 0) => {
@@ -54,8 +70,10 @@ export const quotesAPI = {
 };
 
 export const consultationsAPI = {
-  create: async (data: any) => {
-    const response = await api.post('/consultations', data);
+  create: async (data: any, idempotencyKey?: string) => {
+    // Reuse the same key when retrying so the server replays the first response
+    const headers = idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined;
+    const response = await api.post('/consultations', data, { headers });
     return response.data;
   },
   getAll: async (limit = 50, skip = 0) => {
@@ -68,6 +86,51 @@ export const consultationsAPI = {
   },
 };
 
+// Leads kept on the device per collection, newest first
+const SYNC_CACHE_SIZE = 200;
+
+const mergeLeads = (cached: any[], changed: any[]) => {
+  const byId = new Map(cached.map((lead) => [lead.id, lead]));
+  changed.forEach((lead) => byId.set(lead.id, lead));
+  return Array.from(byId.values())
+    .sort((a, b) => (a.created_at < b.created_at ? 1 : a.created_at > b.created_at ? -1 : 0))
+    .slice(0, SYNC_CACHE_SIZE);
+};
+
+export const syncAPI = {
+  // Fetch leads changed since the stored token, following has_more until caught
+  // up, and merge them into the leads stored with it. The first pull downloads
+  // every lead; later ones only what changed.
+  pull: async (limit = 500) => {
+    let since = await AsyncStorage.getItem('sync_since');
+    const stored = since ? await AsyncStorage.getItem('sync_leads') : null;
+    const leads = stored ? JSON.parse(stored) : { quotes: [], consultations: [] };
+    while (true) {
+      const params = since ? { since, limit } : { limit };
+      const response = await api.get('/admin/sync', { params });
+      leads.quotes = mergeLeads(leads.quotes, response.data.quotes);
+      leads.consultations = mergeLeads(leads.consultations, response.data.consultations);
+      since = response.data.since;
+      if (!response.data.has_more) break;
+    }
+    await AsyncStorage.setItem('sync_leads', JSON.stringify(leads));
+    await AsyncStorage.setItem('sync_since', since as string);
+    return leads as { quotes: any[]; consultations: any[] };
+  },
+  // Apply our own write to the stored lead; the server only hands the change
+  // out once it is older than the sync safety lag
+  patch: async (collection: 'quotes' | 'consultations', id: string, changes: any) => {
+    const stored = await AsyncStorage.getItem('sync_leads');
+    if (!stored) return;
+    const leads = JSON.parse(stored);
+    leads[collection] = leads[collection].map((lead: any) => (lead.id === id ? { ...lead, ...changes } : lead));
+    await AsyncStorage.setItem('sync_leads', JSON.stringify(leads));
+  },
+  reset: async () => {
+    await AsyncStorage.multiRemove(['sync_since', 'sync_leads']);
+  },
+};
+
 export const statsAPI = {
   get: async () => {
     const response = await api.get('/stats');
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Consultation Slot Backfill Script
+Claims calendar slots for consultations booked before slot claiming existed.
+
+Consultations are processed oldest first, so when two bookings share a slot the
+earlier one keeps it. Consultations in a slot-releasing status (rejected or
+closed by default, see SLOT_RELEASING_STATUSES) are skipped. Bookings whose date
+or time cannot be parsed, and later bookings of an already claimed slot, are
+reported for staff to resolve.
+Already claimed slots are left alone, so the script can be re-run at any time.
+"""
+
+import argparse
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError
+
+TIME_FORMATS = ("%H:%M", "%I:%M %p")
+
+
+def parse_slot(preferred_date, preferred_time):
+    """Return the slot as (YYYY-MM-DD, HH:MM), or None when it cannot be parsed."""
+    try:
+        date = datetime.strptime(preferred_date.strip(), "%Y-%m-%d").date().isoformat()
+    except (AttributeError, ValueError):
+        return None
+    for time_format in TIME_FORMATS:
+        try:
+            return date, datetime.strptime(preferred_time.strip().upper(), time_format).strftime("%H:%M")
+        except (AttributeError, ValueError):
+            continue
+    return None
+
+
+def backfill(db, include_past, dry_run=False):
+    today = datetime.now(timezone.utc).date().isoformat()
+    releasing = os.environ.get('SLOT_RELEASING_STATUSES', 'rejected,closed').split(',')
+    query = {"status": {"$nin": releasing}}
+    claimed = conflicts = unparseable = 0
+
+    for consultation in db.consultations.find(query, {"_id": 0}).sort([("created_at", 1), ("id", 1)]):
+        slot = parse_slot(consultation.get("preferred_date"), consultation.get("preferred_time"))
+        if slot is None:
+            unparseable += 1
+            print(f"   ⚠️  {consultation['id']}: unparseable slot "
+                  f"{consultation.get('preferred_date')!r} {consultation.get('preferred_time')!r}")
+            continue
+        if slot[0] < today and not include_past:
+            continue
+
+        existing = db.consultation_slots.find_one({"_id": f"{slot[0]}|{slot[1]}"})
+        if existing is not None:
+            if existing["consultation_id"] != consultation["id"]:
+                conflicts += 1
+                print(f"   ⚠️  {consultation['id']}: {slot[0]} {slot[1]} already held by {existing['consultation_id']}")
+            continue
+        if dry_run:
+            claimed += 1
+            continue
+
+        try:
+            db.consultation_slots.insert_one({
+                "_id": f"{slot[0]}|{slot[1]}",
+                "date": slot[0],
+                "time": slot[1],
+                "consultation_id": consultation["id"],
+                "claimed_at": datetime.now(timezone.utc),
+            })
+            claimed += 1
+        except DuplicateKeyError:
+            # Claimed by a live booking since we looked
+            conflicts += 1
+            print(f"   ⚠️  {consultation['id']}: {slot[0]} {slot[1]} was claimed concurrently")
+
+    return claimed, conflicts, unparseable
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Claim calendar slots for existing consultations")
+    parser.add_argument("--include-past", action="store_true", help="Also claim slots for past dates")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be claimed")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).resolve().parent.parent / 'backend' / '.env')
+    client = MongoClient(os.environ['MONGO_URL'], tz_aware=True)
+    db = client[os.environ['DB_NAME']]
+
+    print("=" * 60)
+    print("Consultation Slot Backfill")
+    print("=" * 60)
+
+    try:
+        claimed, conflicts, unparseable = backfill(db, args.include_past, args.dry_run)
+    finally:
+        client.close()
+
+    print()
+    print(f"🚀 Done. {claimed} slots claimed, {conflicts} conflicts, {unparseable} unparseable.")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n❌ Backfill interrupted. Re-run to resume.")
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Backend Load Benchmark
+Boots the FastAPI app from backend/server.py in-process, seeds realistic lead
+volumes and drives a concurrent mixed workload against it. Results (p50/p95/p99
+latency per operation and overall req/s) are printed as JSON so runs can be
+compared between commits. Needs the dev requirements
+(pip install -r backend/requirements-dev.txt).
+
+    # in-memory Mongo stand-in (mongomock-motor)
+    python scripts/benchmark_backend.py --quotes 10000 --duration 30
+
+    # local mongod, large volumes; --drop clears the benchmark database first
+    python scripts/benchmark_backend.py --mongo-url mongodb://localhost:27017 --quotes 1000000 --drop
+
+Against a real mongod the script refuses to seed a database that already holds
+leads unless --drop is given. --mongo-url and --db-name always win over
+MONGO_URL and DB_NAME from the environment.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import secrets
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / 'backend'
+
+SERVICES = ["development", "deployment", "qa", "all"]
+BUDGETS = ["under-5k", "5k-10k", "10k-25k", "25k-50k", "over-50k", None]
+TOPICS = ["development", "deployment", "qa", "general"]
+TIMES = ["09:00", "10:00", "11:00", "14:00", "15:00", "16:00"]
+STATUSES = ["pending", "pending", "pending", "contacted", "closed"]
+
+# Relative weight of each operation in the mixed workload
+WORKLOAD = {
+    "submit_quote": 30,
+    "submit_consultation": 15,
+    "dashboard": 20,
+    "deep_page_skip": 10,
+    "deep_page_cursor": 10,
+    "status_patch": 15,
+}
+
+
+def quote_doc(index, created_at):
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Lead {index}",
+        "email": f"lead{index}@example.com",
+        "company": f"Company {index % 500}",
+        "service": random.choice(SERVICES),
+        "budget": random.choice(BUDGETS),
+        "description": "Need a full-stack web application for my business",
+        "status": random.choice(STATUSES),
+        "created_at": created_at,
+    }
+
+
+def consultation_doc(index, created_at):
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Lead {index}",
+        "email": f"lead{index}@example.com",
+        "phone": "+1234567890",
+        "preferred_date": (created_at + timedelta(days=7)).date().isoformat(),
+        "preferred_time": random.choice(TIMES),
+        "topic": random.choice(TOPICS),
+        "message": "Would like to discuss project requirements",
+        "status": random.choice(STATUSES),
+        "created_at": created_at,
+    }
+
+
+SEEDED_COLLECTIONS = ("quotes", "consultations", "consultation_slots")
+
+
+async def seed(db, quotes, consultations, batch_size=10000):
+    """Insert seed data and return the quote and consultation ids."""
+    now = datetime.now(timezone.utc)
+    ids = {}
+    for name, count, build in (("quotes", quotes, quote_doc), ("consultations", consultations, consultation_doc)):
+        ids[name] = []
+        for start in range(0, count, batch_size):
+            docs = [build(i, now - timedelta(minutes=i)) for i in range(start, min(start + batch_size, count))]
+            await db[name].insert_many(docs)
+            ids[name].extend(doc["id"] for doc in docs)
+        print(f"🌱 Seeded {count} {name}", file=sys.stderr)
+    return ids
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, conflicts):
+    summary = {}
+    for operation, values in sorted(latencies.items()):
+        values.sort()
+        summary[operation] = {
+            "count": len(values),
+            "errors": errors.get(operation, 0),
+            "conflicts": conflicts.get(operation, 0),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        }
+    return summary
+
+
+def free_slots(days, times):
+    """Every bookable (date, time) from tomorrow on, handed out once across all workers."""
+    today = datetime.now(timezone.utc).date()
+    for offset in range(1, days + 1):
+        for time_of_day in times:
+            yield (today + timedelta(days=offset)).isoformat(), time_of_day
+
+
+class Workload:
+    """One worker's view of the mixed workload."""
+
+    def __init__(self, http, headers, ids, rng, deep_skip, slots):
+        self.http = http
+        self.headers = headers
+        self.ids = ids
+        self.rng = rng
+        self.deep_skip = deep_skip
+        self.slots = slots
+        self.cursor = None
+
+    async def submit_quote(self):
+        return await self.http.post("/api/quotes", json={
+            "name": "Bench Lead",
+            "email": "bench@example.com",
+            "company": "Bench Co",
+            "service": self.rng.choice(SERVICES),
+            "budget": self.rng.choice(BUDGETS),
+            "description": f"Benchmark submission {uuid.uuid4()}",
+        })
+
+    async def submit_consultation(self):
+        # Book a slot nobody holds yet, so this measures bookings rather than 409s
+        preferred_date, preferred_time = next(self.slots)
+        return await self.http.post("/api/consultations", json={
+            "name": "Bench Lead",
+            "email": "bench@example.com",
+            "preferred_date": preferred_date,
+            "preferred_time": preferred_time,
+            "topic": self.rng.choice(TOPICS),
+            "message": f"Benchmark booking {uuid.uuid4()}",
+        })
+
+    async def dashboard(self):
+        return await self.http.get("/api/admin/dashboard", headers=self.headers)
+
+    async def deep_page_skip(self):
+        skip = self.rng.randint(0, self.deep_skip)
+        return await self.http.get("/api/quotes", params={"limit": 50, "skip": skip}, headers=self.headers)
+
+    async def deep_page_cursor(self):
+        params = {"limit": 50}
+        if self.cursor:
+            params["cursor"] = self.cursor
+        response = await self.http.get("/api/quotes", params=params, headers=self.headers)
+        self.cursor = response.headers.get("x-next-cursor")
+        return response
+
+    async def status_patch(self):
+        collection = self.rng.choice(["quotes", "consultations"])
+        item_id = self.rng.choice(self.ids[collection])
+        return await self.http.patch(
+            f"/api/{collection}/{item_id}/status",
+            params={"status": self.rng.choice(["pending", "contacted", "closed"])},
+            headers=self.headers,
+        )
+
+
+async def run(args):
+    # Assigned, not defaulted: an exported MONGO_URL or DB_NAME must never
+    # point the seeding below at a real database
+    os.environ['MONGO_URL'] = args.mongo_url or 'mongodb://localhost:27017'
+    os.environ['DB_NAME'] = args.db_name
+    # Seeds the benchmark database's admin credential; the benchmark signs its own tokens
+    os.environ.setdefault('ADMIN_PASSWORD', secrets.token_urlsafe(16))
+    # All load comes from one client address; keep the public limiter out of the way
+    os.environ.setdefault('RATE_LIMIT_PER_MINUTE', '100000000')
+    os.environ.setdefault('RATE_LIMIT_BURST', '100000000')
+    # Open the calendar wide enough that submit_consultation never runs out of free slots
+    os.environ.setdefault('CONSULTATION_BOOKING_DAYS', '36500')
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    try:
+        import httpx
+    except ImportError:
+        sys.exit("❌ httpx is required: pip install -r backend/requirements-dev.txt")
+
+    import server
+
+    if args.mongo_url is None:
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("❌ mongomock-motor is required without --mongo-url: pip install -r backend/requirements-dev.txt")
+        server.client = AsyncMongoMockClient(tz_aware=True)
+        server.db = server.read_db = server.client[args.db_name]
+    else:
+        await server.connect_mongo()
+        await server.ensure_indexes()
+
+    for name in SEEDED_COLLECTIONS:
+        if args.drop:
+            await server.db[name].delete_many({})
+        elif await server.db[name].count_documents({}, limit=1):
+            sys.exit(f"❌ {args.db_name}.{name} is not empty; pass --drop to clear it before seeding")
+
+    random.seed(args.seed)
+    ids = await seed(server.db, args.quotes, args.consultations)
+
+    credential = await server.get_admin_credential()
+    token = server.create_access_token({"sub": "admin", "ver": credential["version"]})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    operations = list(WORKLOAD)
+    weights = [WORKLOAD[operation] for operation in operations]
+    latencies = {operation: [] for operation in operations}
+    errors = {}
+    conflicts = {}
+    slots = free_slots(server.CONSULTATION_BOOKING_DAYS, server.CONSULTATION_SLOT_TIMES)
+    deadline = time.perf_counter() + args.duration
+
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http:
+        async def worker(worker_id):
+            rng = random.Random(args.seed + worker_id)
+            workload = Workload(http, headers, ids, rng, min(args.deep_skip, max(args.quotes - 50, 0)), slots)
+            while time.perf_counter() < deadline:
+                operation = rng.choices(operations, weights)[0]
+                started = time.perf_counter()
+                response = await getattr(workload, operation)()
+                latencies[operation].append(time.perf_counter() - started)
+                if response.status_code == 409:
+                    conflicts[operation] = conflicts.get(operation, 0) + 1
+                elif response.status_code >= 400:
+                    errors[operation] = errors.get(operation, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    total = sum(len(values) for values in latencies.values())
+    all_latencies = sorted(value for values in latencies.values() for value in values)
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=BACKEND_DIR,
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        "commit": commit,
+        "backend": "mongod" if args.mongo_url else "mongomock",
+        "seeded": {"quotes": args.quotes, "consultations": args.consultations},
+        "concurrency": args.concurrency,
+        "duration_s": round(elapsed, 3),
+        "requests": total,
+        "requests_per_s": round(total / elapsed, 2) if elapsed else 0,
+        "overall": {
+            "p50_ms": round(percentile(all_latencies, 0.50) * 1000, 3) if all_latencies else None,
+            "p95_ms": round(percentile(all_latencies, 0.95) * 1000, 3) if all_latencies else None,
+            "p99_ms": round(percentile(all_latencies, 0.99) * 1000, 3) if all_latencies else None,
+        },
+        "operations": summarize(latencies, errors, conflicts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the backend in-process")
+    parser.add_argument("--mongo-url", help="Use a real mongod instead of mongomock-motor")
+    parser.add_argument("--db-name", default="benchmark")
+    parser.add_argument("--drop", action="store_true", help="Clear existing leads in --db-name before seeding")
+    parser.add_argument("--quotes", type=int, default=10000)
+    parser.add_argument("--consultations", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to drive load for")
+    parser.add_argument("--deep-skip", type=int, default=5000, help="Largest skip used by deep_page_skip")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compression Benchmark
+Requests typical list pages and the services catalog from the in-process app
+(backed by mongomock-motor) with each Accept-Encoding, and reports payload size,
+server-side time and the estimated transfer time over common link speeds.
+Needs the dev requirements (pip install -r backend/requirements-dev.txt).
+
+    python scripts/benchmark_compression.py --pages 50 200 --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import secrets
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'benchmark')
+# Seeds the benchmark database's admin credential; the benchmark signs its own tokens
+os.environ.setdefault('ADMIN_PASSWORD', secrets.token_urlsafe(16))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
+
+import httpx  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+import server  # noqa: E402
+
+ENCODINGS = ["identity", "gzip", "br"]
+
+# Link speeds in megabits per second
+LINKS = {"3g": 1.6, "4g": 12, "broadband": 100}
+
+
+def quote_doc(index, created_at):
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Lead {index}",
+        "email": f"lead{index}@example.com",
+        "company": f"Company {index % 50}",
+        "service": "development",
+        "budget": "10k-25k",
+        "description": f"Need a full-stack web application for my business, project #{index}",
+        "status": "pending",
+        "created_at": created_at,
+    }
+
+
+def service_doc(index):
+    return {
+        "id": str(uuid.uuid4()),
+        "name": f"Service {index}",
+        "description": "End-to-end delivery from architecture to production support",
+        "features": ["Architecture", "Implementation", "Testing", "Deployment"],
+        "icon": "Code",
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+async def measure(http, path, params, headers, encoding, repeat):
+    best = float('inf')
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = await http.get(path, params=params, headers={**headers, "Accept-Encoding": encoding})
+        best = min(best, time.perf_counter() - started)
+        size = response.num_bytes_downloaded
+    served_as = response.headers.get("content-encoding", "identity")
+    return {
+        "encoding": served_as,
+        "bytes": size,
+        "server_ms": round(best * 1000, 3),
+        "transfer_ms": {link: round(size * 8 / (mbps * 1e6) * 1000, 2) for link, mbps in LINKS.items()},
+    }
+
+
+async def run(pages, repeat):
+    server.client = AsyncMongoMockClient(tz_aware=True)
+    server.db = server.read_db = server.client['benchmark']
+
+    now = datetime.now(timezone.utc)
+    await server.db.quotes.insert_many([quote_doc(i, now - timedelta(minutes=i)) for i in range(max(pages))])
+    await server.db.services.insert_many([service_doc(i) for i in range(6)])
+
+    credential = await server.get_admin_credential()
+    token = server.create_access_token({"sub": "admin", "ver": credential["version"]})
+    auth = {"Authorization": f"Bearer {token}"}
+
+    targets = [(f"quotes?limit={limit}", "/api/quotes", {"limit": limit}, auth) for limit in pages]
+    targets.append(("services", "/api/services", {}, {}))
+
+    results = []
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http:
+        for name, path, params, headers in targets:
+            for encoding in ENCODINGS:
+                result = await measure(http, path, params, headers, encoding, repeat)
+                results.append({"target": name, "accept_encoding": encoding, **result})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark response compression")
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    results = asyncio.run(run(args.pages, args.repeat))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'target':<16} {'served as':<10} {'bytes':>8} {'server':>10}  " + "  ".join(f"{link:>10}" for link in LINKS))
+    for result in results:
+        transfers = "  ".join(f"{result['transfer_ms'][link]:>7.2f} ms" for link in LINKS)
+        print(
+            f"{result['target']:<16} {result['encoding']:<10} {result['bytes']:>8} "
+            f"{result['server_ms']:>7.2f} ms  {transfers}"
+        )
+
+
+if __name__ == "__main__":
+    main()
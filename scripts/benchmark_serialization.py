@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Serialization Microbenchmark
+Compares the per-row cost of FastAPI's response_model path (validate every row
+through List[QuoteRequest], then encode) with the TrustedJSONResponse path used
+by the list endpoints.
+
+    python scripts/benchmark_serialization.py --sizes 50 500 5000 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'benchmark')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from server import QuoteRequest, TrustedJSONResponse  # noqa: E402
+
+
+def make_rows(count):
+    """Build quote documents shaped like the ones Motor returns."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Lead {i}",
+            "email": f"lead{i}@example.com",
+            "company": "Example Ltd",
+            "service": "development",
+            "budget": "10k-25k",
+            "description": "Need a full-stack web application for my business " * 3,
+            "status": "pending",
+            "created_at": now - timedelta(minutes=i),
+        }
+        for i in range(count)
+    ]
+
+
+async def response_model_path(field, rows):
+    content = await serialize_response(field=field, response_content=rows)
+    return JSONResponse(content).body
+
+
+async def trusted_path(field, rows):
+    return TrustedJSONResponse(rows).body
+
+
+async def measure(path, field, rows, repeat):
+    """Return the best per-row time in microseconds over `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await path(field, rows)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1e6
+
+
+async def run(sizes, repeat):
+    field = create_response_field(name="Response", type_=List[QuoteRequest])
+    results = []
+    for size in sizes:
+        rows = make_rows(size)
+        before = await measure(response_model_path, field, rows, repeat)
+        after = await measure(trusted_path, field, rows, repeat)
+        results.append({
+            "rows": size,
+            "response_model_us_per_row": round(before, 3),
+            "trusted_us_per_row": round(after, 3),
+            "speedup": round(before / after, 2),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.sizes, args.repeat))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'rows':>6}  {'response_model':>16}  {'trusted':>10}  {'speedup':>8}")
+    for result in results:
+        print(
+            f"{result['rows']:>6}  {result['response_model_us_per_row']:>13.2f} us"
+            f"  {result['trusted_us_per_row']:>7.2f} us  {result['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
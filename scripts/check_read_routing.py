@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Read Routing Check
+Verifies against a local replica set that admin reads are served by a secondary
+while writes, and a client's reads right after its own admin write, stay on the
+primary. Other clients keep reading from the secondary.
+
+    ADMIN_READ_PREFERENCE=secondaryPreferred \
+    MONGO_URL="mongodb://localhost:27017,localhost:27018,localhost:27019/?replicaSet=rs0" \
+    python scripts/check_read_routing.py
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('DB_NAME', 'read_routing_check')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
+
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+import server  # noqa: E402
+
+
+def admin_request(headers=None):
+    """A bare request carrying only the given headers, as admin_reads sees it."""
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw})
+
+
+async def served_by(database):
+    """Run one find on the quotes collection and return the address that answered it."""
+    cursor = database.quotes.find({}).limit(1)
+    await cursor.to_list(1)
+    return cursor.address
+
+
+async def main():
+    await server.connect_mongo()
+    try:
+        primary = server.client.primary
+        if primary is None:
+            print("❌ Not connected to a replica set (no primary reported)")
+            return 1
+
+        await server.db.quotes.insert_one({"id": "read-routing-check"})
+        # The insert above is a public write and must not pin admin reads
+        admin_address = await served_by(server.admin_reads(admin_request()))
+        print(f"📖 Admin read served by {admin_address} (primary is {primary})")
+
+        response = Response()
+        server.mark_admin_write(response)
+        writer = admin_request({server.ADMIN_WRITE_HEADER: response.headers[server.ADMIN_WRITE_HEADER]})
+        pinned_address = await served_by(server.admin_reads(writer))
+        print(f"✍️  Read after the client's own admin write served by {pinned_address}")
+        other_address = await served_by(server.admin_reads(admin_request()))
+        print(f"👥 Another client's read served by {other_address}")
+
+        ok = pinned_address == primary
+        if server.ADMIN_READ_PREFERENCE in ('secondary', 'secondaryPreferred'):
+            ok = ok and admin_address != primary and other_address != primary
+
+        print("✅ Read routing behaves as configured" if ok else "❌ Read routing is not behaving as configured")
+        return 0 if ok else 1
+    finally:
+        await server.db.quotes.delete_many({"id": "read-routing-check"})
+        server.client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+created_at Migration Script
+Converts ISO-string created_at values to native BSON datetimes in place, then
+backfills updated_at from created_at on leads written before delta sync existed.
+
+The migration works in batches and only ever selects documents whose
+created_at is still a string, so it can be stopped and re-run at any time.
+"""
+
+import argparse
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient, UpdateOne
+
+COLLECTIONS = ["quotes", "consultations", "services"]
+SYNCED_COLLECTIONS = ["quotes", "consultations"]
+
+
+def parse_created_at(value):
+    """Parse a stored ISO string into a timezone-aware UTC datetime."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def migrate_collection(collection, batch_size, dry_run=False):
+    """Convert one collection batch by batch and return the number of converted documents."""
+    query = {"created_at": {"$type": "string"}}
+    remaining = collection.count_documents(query)
+    print(f"📦 {collection.name}: {remaining} documents to convert")
+
+    if dry_run or remaining == 0:
+        return 0
+
+    converted = 0
+    last_id = None
+    while True:
+        batch_query = dict(query, _id={"$gt": last_id}) if last_id is not None else query
+        batch = list(collection.find(batch_query, {"_id": 1, "created_at": 1}).sort("_id", 1).limit(batch_size))
+        if not batch:
+            break
+        last_id = batch[-1]["_id"]
+
+        operations = []
+        for doc in batch:
+            try:
+                created_at = parse_created_at(doc["created_at"])
+            except ValueError:
+                print(f"   ⚠️  Skipping {doc['_id']}: unparseable created_at {doc['created_at']!r}")
+                continue
+            # Match on the old value so a concurrent writer is never overwritten
+            operations.append(UpdateOne(
+                {"_id": doc["_id"], "created_at": doc["created_at"]},
+                {"$set": {"created_at": created_at}},
+            ))
+
+        if operations:
+            result = collection.bulk_write(operations, ordered=False)
+            converted += result.modified_count
+        print(f"   ✅ {converted}/{remaining} converted")
+
+    return converted
+
+
+def backfill_updated_at(collection, dry_run=False):
+    """Set updated_at to created_at wherever it is missing and return the number of updated documents."""
+    # Only converted datetimes are copied; string created_at values are left for the next run
+    query = {"updated_at": {"$exists": False}, "created_at": {"$type": "date"}}
+    remaining = collection.count_documents(query)
+    print(f"📦 {collection.name}: {remaining} documents without updated_at")
+
+    if dry_run or remaining == 0:
+        return 0
+
+    result = collection.update_many(query, [{"$set": {"updated_at": "$created_at"}}])
+    print(f"   ✅ {result.modified_count}/{remaining} backfilled")
+    return result.modified_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store created_at as native datetimes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many documents need converting")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).resolve().parent.parent / 'backend' / '.env')
+    client = MongoClient(os.environ['MONGO_URL'], tz_aware=True)
+    db = client[os.environ['DB_NAME']]
+
+    print("=" * 60)
+    print("created_at Migration")
+    print("=" * 60)
+
+    try:
+        total = 0
+        for name in COLLECTIONS:
+            total += migrate_collection(db[name], args.batch_size, args.dry_run)
+        for name in SYNCED_COLLECTIONS:
+            total += backfill_updated_at(db[name], args.dry_run)
+    finally:
+        client.close()
+
+    print()
+    print(f"🚀 Done. {total} documents updated.")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n❌ Migration interrupted. Re-run to resume.")
@@ -7,8 +7,13 @@ Run this script to set up your admin password for the first time.
 import os
 import secrets
 import string
+from datetime import datetime, timezone
 from pathlib import Path
 
+import bcrypt
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
 def generate_strong_password(length=16):
     """Generate a strong random password."""
     alphabet = string.ascii_letters + string.digits + string.punctuation
@@ -19,6 +24,25 @@ def generate_jwt_secret(length=32):
     """Generate a secure JWT secret."""
     return secrets.token_urlsafe(length)
 
+def store_admin_credential(env_path, password):
+    """Store the bcrypt hash in Mongo and revoke every previously issued token."""
+    load_dotenv(env_path)
+    client = MongoClient(os.environ['MONGO_URL'])
+    try:
+        client[os.environ['DB_NAME']].admin_credentials.update_one(
+            {"_id": "admin"},
+            {
+                "$set": {
+                    "password_hash": bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode(),
+                    "updated_at": datetime.now(timezone.utc),
+                },
+                "$inc": {"version": 1},
+            },
+            upsert=True,
+        )
+    finally:
+        client.close()
+
 def setup_admin_password():
     """Setup admin password and JWT secret."""
     print("=" * 60)
@@ -60,6 +84,14 @@ def setup_admin_password():
         print("❌ Invalid choice!")
         return
     
+    # Store the credential first: if Mongo is unreachable, .env is left untouched
+    try:
+        store_admin_credential(backend_env, password)
+    except Exception as e:
+        print(f"\n❌ Could not store the admin password in MongoDB: {e}")
+        print("   Nothing was changed. Check MONGO_URL and DB_NAME in backend .env and re-run.")
+        raise SystemExit(1)
+    
     # Generate JWT secret if not present
     jwt_secret = generate_jwt_secret()
     
@@ -68,14 +100,13 @@ def setup_admin_password():
         lines = f.readlines()
     
     # Update env file
-    updated = False
     jwt_updated = False
     new_lines = []
     
     for line in lines:
         if line.startswith('ADMIN_PASSWORD='):
-            new_lines.append(f'ADMIN_PASSWORD="{password}"\n')
-            updated = True
+            # The password now lives in Mongo as a bcrypt hash
+            continue
         elif line.startswith('JWT_SECRET='):
             new_lines.append(f'JWT_SECRET="{jwt_secret}"\n')
             jwt_updated = True
@@ -83,8 +114,6 @@ def setup_admin_password():
             new_lines.append(line)
     
     # Add if not present
-    if not updated:
-        new_lines.append(f'ADMIN_PASSWORD="{password}"\n')
     if not jwt_updated:
         new_lines.append(f'JWT_SECRET="{jwt_secret}"\n')
     
@@ -119,3 +148,4 @@ if __name__ == "__main__":
         print("\n\n❌ Setup cancelled.")
     except Exception as e:
         print(f"\n❌ Error: {e}")
+        raise SystemExit(1)
@@ -0,0 +1,77 @@
+"""
+Fixtures for the in-process backend tests.
+
+The app from backend/server.py is driven through httpx's ASGI transport
+against a mongomock-motor database, so no mongod or network is needed:
+
+    pip install -r backend/requirements-dev.txt
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'test')
+os.environ.setdefault('ADMIN_PASSWORD', 'test-admin-password')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'backend'))
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+import server  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """A fresh database plus fresh copies of every piece of per-process state."""
+    client = AsyncMongoMockClient(tz_aware=True)
+    database = client['test']
+    monkeypatch.setattr(server, 'client', client)
+    monkeypatch.setattr(server, 'db', database)
+    monkeypatch.setattr(server, 'read_db', database)
+
+    # Tests submit many leads from one address; rate limiting has its own tests
+    monkeypatch.setattr(server, 'rate_limiter', server.TokenBucketLimiter(100000, 100000))
+    monkeypatch.setattr(server, 'deduplicator', server.SubmissionDeduplicator(server.DEDUP_WINDOW_SECONDS))
+    monkeypatch.setattr(server, 'idempotency_store', server.IdempotencyStore(100, server.IDEMPOTENCY_TTL_SECONDS))
+    monkeypatch.setattr(server, 'token_cache', server.VerifiedTokenCache(100))
+    monkeypatch.setattr(server, 'credential_cache', {"value": None, "expires_at": 0.0})
+    monkeypatch.setattr(server, 'stats_cache', {"value": None, "expires_at": 0.0, "generation": 0})
+    monkeypatch.setattr(server, 'event_broker', server.EventBroker(server.EVENTS_QUEUE_SIZE))
+    monkeypatch.setattr(server, 'services_catalog', {"body": None, "etag": None})
+    return database
+
+
+@pytest.fixture
+async def api(db):
+    transport = httpx.ASGITransport(app=server.app, client=("203.0.113.10", 50000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        yield http
+
+
+@pytest.fixture
+async def admin_headers(db):
+    credential = await server.get_admin_credential()
+    token = server.create_access_token({"sub": "admin", "ver": credential["version"]})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def quote_payload(**overrides):
+    payload = {
+        "name": "Test Lead",
+        "email": "lead@example.com",
+        "company": "Example Ltd",
+        "service": "development",
+        "budget": "10k-25k",
+        "description": "Need a web application",
+    }
+    payload.update(overrides)
+    return payload
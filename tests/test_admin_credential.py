@@ -0,0 +1,21 @@
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_fresh_database_without_admin_password_refuses_login(api, db, monkeypatch):
+    monkeypatch.setattr(server, "ADMIN_PASSWORD", None)
+
+    for password in ("admin123", ""):
+        response = await api.post("/api/admin/login", json={"password": password})
+        assert response.status_code == 503
+    assert await db.admin_credentials.count_documents({}) == 0
+
+
+async def test_fresh_database_is_seeded_from_admin_password(api, db, monkeypatch):
+    monkeypatch.setattr(server, "ADMIN_PASSWORD", "seeded-password")
+
+    assert (await api.post("/api/admin/login", json={"password": "admin123"})).status_code == 401
+    assert (await api.post("/api/admin/login", json={"password": "seeded-password"})).status_code == 200
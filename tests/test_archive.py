@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+async def store_quote(db, age_days, **fields):
+    created_at = datetime.now(timezone.utc) - timedelta(days=age_days)
+    lead = server.QuoteRequest(**quote_payload(), created_at=created_at, updated_at=created_at, **fields)
+    await db.quotes.insert_one(lead.model_dump())
+    return lead.id
+
+
+async def test_archive_moves_old_and_settled_leads(db):
+    old = await store_quote(db, server.ARCHIVE_AFTER_DAYS + 1)
+    settled = await store_quote(db, server.ARCHIVE_TERMINAL_AFTER_DAYS + 1, status="rejected")
+    fresh = await store_quote(db, 1)
+    open_lead = await store_quote(db, server.ARCHIVE_TERMINAL_AFTER_DAYS + 1)
+
+    moved = await server.archive_leads("quotes", batch_size=1)
+
+    assert moved == 2
+    assert sorted(await db.quotes.distinct("id")) == sorted([fresh, open_lead])
+    assert sorted(await db.quotes_archive.distinct("id")) == sorted([old, settled])
+
+
+async def test_lead_modified_mid_move_stays_hot(db, monkeypatch):
+    # Settled rather than aged out, so reopening it makes it no longer archivable
+    target = await store_quote(db, server.ARCHIVE_TERMINAL_AFTER_DAYS + 1, status="rejected")
+    other = await store_quote(db, server.ARCHIVE_AFTER_DAYS + 2)
+    collection_type = type(db.quotes)
+    bulk_write = collection_type.bulk_write
+
+    async def bulk_write_racing_an_admin(self, requests, *args, **kwargs):
+        if self.name == "quotes":
+            # An admin changes the lead after it was copied but before it is deleted
+            await db.quotes.update_one(
+                {"id": target},
+                {"$set": {"status": "pending", "updated_at": datetime.now(timezone.utc)}},
+            )
+        return await bulk_write(self, requests, *args, **kwargs)
+
+    monkeypatch.setattr(collection_type, "bulk_write", bulk_write_racing_an_admin)
+    moved = await server.archive_leads("quotes", batch_size=10)
+    monkeypatch.setattr(collection_type, "bulk_write", bulk_write)
+
+    # The other lead moved; the modified one kept its change and lost its stale archived copy
+    assert moved == 1
+    assert await db.quotes_archive.distinct("id") == [other]
+    assert (await db.quotes.find_one({"id": target}))["status"] == "pending"
+
+
+async def test_archived_leads_are_read_only(api, db, admin_headers):
+    archived = await store_quote(db, server.ARCHIVE_AFTER_DAYS + 1)
+    hot = await store_quote(db, 1)
+    await server.archive_leads("quotes", batch_size=10)
+
+    single = await api.patch(f"/api/quotes/{archived}/status", params={"status": "approved"}, headers=admin_headers)
+    assert single.status_code == 409
+
+    missing = await api.patch("/api/quotes/nope/status", params={"status": "approved"}, headers=admin_headers)
+    assert missing.status_code == 404
+
+    bulk = await api.patch(
+        "/api/quotes/status", json={"status": "approved", "ids": [archived, hot, "nope"]}, headers=admin_headers,
+    )
+    assert bulk.json() == {"matched": 1, "modified": 1, "not_found": ["nope"], "archived": [archived]}
+
+
+async def test_archived_leads_are_listed_as_archived_and_counted_on_request(api, db, admin_headers):
+    archived = await store_quote(db, server.ARCHIVE_AFTER_DAYS + 1)
+    hot = await store_quote(db, 1)
+    await server.archive_leads("quotes", batch_size=10)
+
+    items = (await api.get("/api/quotes", params={"include_archived": True}, headers=admin_headers)).json()
+    assert [(item["id"], item.get("archived", False)) for item in items] == [(hot, False), (archived, True)]
+
+    assert (await api.get("/api/stats", headers=admin_headers)).json()["total_quotes"] == 1
+    stats = (await api.get("/api/stats", params={"include_archived": True}, headers=admin_headers)).json()
+    assert stats["total_quotes"] == 2
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+TOMORROW = (datetime.now(timezone.utc) + timedelta(days=1)).date().isoformat()
+
+
+def booking(preferred_date=TOMORROW, preferred_time="10:00", **overrides):
+    payload = {
+        "name": "Test Lead",
+        "email": "lead@example.com",
+        "preferred_date": preferred_date,
+        "preferred_time": preferred_time,
+        "topic": "development",
+        "message": "Let's talk",
+    }
+    payload.update(overrides)
+    return payload
+
+
+async def test_concurrent_bookings_of_one_slot_admit_exactly_one(api, db):
+    responses = await asyncio.gather(*(
+        api.post("/api/consultations", json=booking(message=f"Booking {index}")) for index in range(10)
+    ))
+
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [200] + [409] * 9
+    assert await db.consultations.count_documents({}) == 1
+    assert await db.consultation_slots.count_documents({}) == 1
+
+
+async def test_rejecting_a_booking_releases_its_slot(api, db, admin_headers):
+    first = (await api.post("/api/consultations", json=booking())).json()
+    assert (await api.post("/api/consultations", json=booking(message="Second"))).status_code == 409
+
+    response = await api.patch(
+        f"/api/consultations/{first['id']}/status", params={"status": "rejected"}, headers=admin_headers,
+    )
+    assert response.status_code == 200
+    assert await db.consultation_slots.count_documents({}) == 0
+    assert (await api.post("/api/consultations", json=booking(message="Second"))).status_code == 200
+
+
+async def test_approving_a_booking_keeps_its_slot(api, db, admin_headers):
+    first = (await api.post("/api/consultations", json=booking())).json()
+    await api.patch(f"/api/consultations/{first['id']}/status", params={"status": "approved"}, headers=admin_headers)
+
+    assert await db.consultation_slots.count_documents({"consultation_id": first["id"]}) == 1
+
+
+@pytest.mark.parametrize("by_ids", [True, False])
+async def test_bulk_close_releases_slots(api, db, admin_headers, by_ids):
+    created = [
+        (await api.post("/api/consultations", json=booking(preferred_time=t, message=t))).json()
+        for t in ("09:00", "10:00", "11:00")
+    ]
+    selector = {"ids": [c["id"] for c in created[:2]]} if by_ids else {"current_status": "pending"}
+
+    response = await api.patch(
+        "/api/consultations/status", json={"status": "closed", **selector}, headers=admin_headers,
+    )
+
+    assert response.status_code == 200
+    remaining = await db.consultation_slots.distinct("consultation_id")
+    assert remaining == ([created[2]["id"]] if by_ids else [])
+
+
+async def test_past_times_today_are_neither_offered_nor_bookable(api, db, monkeypatch):
+    monkeypatch.setattr(server, "CONSULTATION_SLOT_TIMES", ["00:00", "23:59"])
+    today = datetime.now(timezone.utc).date().isoformat()
+
+    response = await api.post("/api/consultations", json=booking(preferred_date=today, preferred_time="00:00"))
+    assert response.status_code == 400
+
+    days = (await api.get("/api/consultations/availability", params={"days": 2})).json()["days"]
+    assert days[0]["date"] == today
+    assert "00:00" not in days[0]["available"]
+    assert days[1]["available"] == ["00:00", "23:59"]
+
+
+async def test_today_follows_the_business_timezone(api, db, monkeypatch):
+    # Pick a zone whose calendar date differs from UTC right now
+    utc_now = datetime.now(timezone.utc)
+    zone = ZoneInfo("Etc/GMT+12" if utc_now.hour < 12 else "Pacific/Kiritimati")
+    local_today = datetime.now(zone).date()
+    monkeypatch.setattr(server, "BUSINESS_TIMEZONE", zone)
+    monkeypatch.setattr(server, "CONSULTATION_SLOT_TIMES", ["00:00", "23:59"])
+
+    response = await api.get("/api/consultations/availability", params={"days": 2})
+    body = response.json()
+    assert body["today"] == local_today.isoformat()
+    assert body["days"][0]["date"] == local_today.isoformat()
+    assert response.headers["Cache-Control"] == "public, no-cache"
+
+    past = await api.post("/api/consultations", json=booking(preferred_date=local_today.isoformat(), preferred_time="00:00"))
+    assert past.status_code == 400
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+async def issue_ticket(api, admin_headers):
+    response = await api.post("/api/admin/events/ticket", headers=admin_headers)
+    assert response.status_code == 200
+    return response.json()["ticket"]
+
+
+async def test_ticket_is_short_lived_and_bound_to_the_session(api, admin_headers):
+    ticket = jwt.decode(await issue_ticket(api, admin_headers), server.JWT_SECRET, algorithms=[server.JWT_ALGORITHM])
+    session = jwt.decode(admin_headers["Authorization"].split()[1], server.JWT_SECRET, algorithms=[server.JWT_ALGORITHM])
+
+    assert ticket["scope"] == "events"
+    assert ticket["exp"] <= time.time() + server.EVENTS_TICKET_SECONDS
+    assert ticket["session_exp"] == session["exp"]
+
+
+async def test_stream_accepts_a_ticket_but_not_the_admin_token_in_the_url(api, admin_headers):
+    token = admin_headers["Authorization"].split()[1]
+    assert (await server.verify_stream_token(ticket=await issue_ticket(api, admin_headers), credentials=None))["scope"] == "events"
+
+    with pytest.raises(server.HTTPException) as refused:
+        await server.verify_stream_token(ticket=token, credentials=None)
+    assert refused.value.status_code == 401
+
+    response = await api.get("/api/admin/events", params={"token": token})
+    assert response.status_code == 403
+
+
+async def test_ticket_cannot_be_used_as_an_admin_token(api, admin_headers):
+    ticket = await issue_ticket(api, admin_headers)
+    response = await api.get("/api/stats", headers={"Authorization": f"Bearer {ticket}"})
+    assert response.status_code == 401
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+async def test_stream_ends_when_the_session_expires(db, admin_headers, monkeypatch):
+    monkeypatch.setattr(server, "EVENTS_HEARTBEAT_SECONDS", 0.05)
+    credential = await server.get_admin_credential()
+    auth = {"ver": credential["version"], "session_exp": time.time() + 0.2}
+
+    chunks = await asyncio.wait_for(collect(server.stream_events(server.event_broker.subscribe(), auth)), 2)
+
+    assert b": keepalive\n\n" in chunks
+    assert chunks[-1].startswith(b"event: reauth")
+    assert not server.event_broker.subscribers
+
+
+async def test_stream_ends_after_a_password_change(db, admin_headers, monkeypatch):
+    monkeypatch.setattr(server, "EVENTS_HEARTBEAT_SECONDS", 0.05)
+    credential = await server.get_admin_credential()
+    auth = {"ver": credential["version"], "session_exp": time.time() + 3600}
+    stream = server.stream_events(server.event_broker.subscribe(), auth)
+    assert await stream.__anext__() == b"retry: 3000\n\n"
+
+    await db.admin_credentials.update_one({"_id": "admin"}, {"$inc": {"version": 1}})
+    server.credential_cache["value"] = None
+
+    rest = await asyncio.wait_for(collect(stream), 2)
+    assert rest[-1].startswith(b"event: reauth")
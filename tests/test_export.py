@@ -0,0 +1,31 @@
+import csv
+import io
+import json
+
+import pytest
+
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_ndjson_export_includes_fresh_lead(api, admin_headers):
+    created = (await api.post("/api/quotes", json=quote_payload())).json()
+
+    response = await api.get("/api/quotes/export", headers=admin_headers)
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [created["id"]]
+    # Mongo stores datetimes with millisecond precision
+    assert rows[0]["updated_at"][:23] == created["updated_at"][:23]
+
+
+async def test_csv_export_includes_fresh_lead(api, admin_headers):
+    created = (await api.post("/api/quotes", json=quote_payload())).json()
+
+    response = await api.get("/api/quotes/export", params={"format": "csv"}, headers=admin_headers)
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["id"] for row in rows] == [created["id"]]
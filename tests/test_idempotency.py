@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pymongo.errors import AutoReconnect
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+async def post_quote(api, key, **overrides):
+    return await api.post("/api/quotes", json=quote_payload(**overrides), headers={"Idempotency-Key": key})
+
+
+async def test_retry_replays_first_response(api, db):
+    first = await post_quote(api, "retry-1")
+    second = await post_quote(api, "retry-1")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+    assert await db.quotes.count_documents({}) == 1
+
+
+async def test_replay_survives_a_cold_cache(api, db):
+    first = await post_quote(api, "cold-1")
+    server.idempotency_store.cache.clear()
+    second = await post_quote(api, "cold-1")
+
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+
+
+async def test_key_reused_with_different_payload_is_rejected(api, db):
+    await post_quote(api, "mismatch-1")
+    response = await post_quote(api, "mismatch-1", description="Something else entirely")
+
+    assert response.status_code == 422
+    assert await db.quotes.count_documents({}) == 1
+
+
+async def test_failed_insert_abandons_the_claim(api, db, monkeypatch):
+    original_insert = server.insert_submission
+
+    async def failing_insert(*args, **kwargs):
+        raise AutoReconnect("primary stepped down")
+
+    monkeypatch.setattr(server, "insert_submission", failing_insert)
+    with pytest.raises(AutoReconnect):
+        await post_quote(api, "abandon-1")
+    assert await db.idempotency_keys.count_documents({}) == 0
+
+    monkeypatch.setattr(server, "insert_submission", original_insert)
+    response = await post_quote(api, "abandon-1")
+    assert response.status_code == 200
+    assert await db.quotes.count_documents({}) == 1
+
+
+async def test_fresh_in_progress_claim_conflicts(api, db):
+    await db.idempotency_keys.insert_one({
+        "_id": "quotes:busy-1",
+        "fingerprint": server.submission_fingerprint("quotes", server.QuoteRequestCreate(**quote_payload())),
+        "state": "in_progress",
+        "lead_id": "not-stored-yet",
+        "claimed_at": datetime.now(timezone.utc),
+        "created_at": datetime.now(timezone.utc),
+    })
+
+    response = await post_quote(api, "busy-1")
+    assert response.status_code == 409
+
+
+async def stale_claim(db, key, lead_id):
+    claimed_at = datetime.now(timezone.utc) - timedelta(seconds=server.IDEMPOTENCY_LEASE_SECONDS + 5)
+    await db.idempotency_keys.insert_one({
+        "_id": f"quotes:{key}",
+        "fingerprint": server.submission_fingerprint("quotes", server.QuoteRequestCreate(**quote_payload())),
+        "state": "in_progress",
+        "lead_id": lead_id,
+        "claimed_at": claimed_at,
+        "created_at": claimed_at,
+    })
+
+
+async def test_stale_claim_replays_the_stored_lead(api, db):
+    # The first request stored its lead and died before completing the key
+    lead = server.QuoteRequest(**quote_payload())
+    await db.quotes.insert_one(lead.model_dump())
+    await stale_claim(db, "stale-1", lead.id)
+
+    response = await post_quote(api, "stale-1")
+
+    assert response.status_code == 200
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert response.json()["id"] == lead.id
+    assert await db.quotes.count_documents({}) == 1
+    stored = await db.idempotency_keys.find_one({"_id": "quotes:stale-1"})
+    assert stored["state"] == "completed"
+
+
+async def test_stale_claim_without_lead_is_taken_over(api, db):
+    await stale_claim(db, "stale-2", "never-stored")
+
+    response = await post_quote(api, "stale-2")
+
+    assert response.status_code == 200
+    assert "Idempotent-Replayed" not in response.headers
+    assert await db.quotes.count_documents({"id": response.json()["id"]}) == 1
+    stored = await db.idempotency_keys.find_one({"_id": "quotes:stale-2"})
+    assert stored["state"] == "completed"
+    assert stored["lead_id"] == response.json()["id"]
+
+
+async def test_failed_complete_still_answers_and_recovers(api, db, monkeypatch):
+    original_update = db.idempotency_keys.update_one
+
+    async def failing_update(*args, **kwargs):
+        raise AutoReconnect("primary stepped down")
+
+    monkeypatch.setattr(db.idempotency_keys, "update_one", failing_update)
+    first = await post_quote(api, "complete-1")
+    assert first.status_code == 200
+
+    # Another worker: no hot cache, and the claim has outlived its lease
+    monkeypatch.setattr(db.idempotency_keys, "update_one", original_update)
+    server.idempotency_store.cache.clear()
+    await db.idempotency_keys.update_one(
+        {"_id": "quotes:complete-1"},
+        {"$set": {"claimed_at": datetime.now(timezone.utc) - timedelta(hours=1)}},
+    )
+    second = await post_quote(api, "complete-1")
+
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    assert await db.quotes.count_documents({}) == 1
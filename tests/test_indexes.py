@@ -0,0 +1,66 @@
+import pytest
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+class ConflictingCollection:
+    """Reports IndexOptionsConflict on the first create_indexes, as mongod does when a TTL changed.
+
+    mongomock has no collMod, so the retry after it is only recorded.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.create_calls = 0
+
+    async def create_indexes(self, indexes):
+        self.create_calls += 1
+        if self.create_calls == 1:
+            raise OperationFailure("Index already exists with different options", code=85)
+
+    async def index_information(self):
+        return await self.collection.index_information()
+
+
+async def test_changed_ttl_is_applied_with_collmod(db, monkeypatch):
+    await db.idempotency_keys.create_indexes([
+        IndexModel([("created_at", ASCENDING)], name="created_at_ttl", expireAfterSeconds=60),
+    ])
+    conflicting = ConflictingCollection(db.idempotency_keys)
+    commands = []
+
+    class Database:
+        def __getitem__(self, name):
+            return conflicting if name == "idempotency_keys" else db[name]
+
+        async def command(self, command):
+            commands.append(command)
+
+    monkeypatch.setattr(server, "db", Database())
+    monkeypatch.setattr(server, "INDEXES", {"idempotency_keys": server.INDEXES["idempotency_keys"]})
+
+    await server.ensure_indexes()
+
+    assert commands == [{
+        "collMod": "idempotency_keys",
+        "index": {"name": "created_at_ttl", "expireAfterSeconds": server.IDEMPOTENCY_TTL_SECONDS},
+    }]
+    assert conflicting.create_calls == 2
+
+
+async def test_other_index_failures_still_raise(db, monkeypatch):
+    class FailingCollection:
+        async def create_indexes(self, indexes):
+            raise OperationFailure("bad index", code=67)
+
+    class Database:
+        def __getitem__(self, name):
+            return FailingCollection()
+
+    monkeypatch.setattr(server, "db", Database())
+    with pytest.raises(OperationFailure):
+        await server.ensure_indexes()
@@ -0,0 +1,25 @@
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("path, params", [
+    ("/api/quotes", {"limit": server.MAX_PAGE_SIZE + 1}),
+    ("/api/consultations", {"limit": 0}),
+    ("/api/quotes", {"skip": -1}),
+    ("/api/quotes/search", {"limit": 10**9}),
+    ("/api/consultations/search", {"limit": server.MAX_PAGE_SIZE + 1}),
+    ("/api/admin/dashboard", {"quotes_limit": server.MAX_PAGE_SIZE + 1}),
+    ("/api/admin/dashboard", {"consultations_limit": 10**9}),
+    ("/api/admin/sync", {"limit": server.MAX_SYNC_PAGE_SIZE + 1}),
+])
+async def test_oversized_pages_are_rejected(api, admin_headers, path, params):
+    response = await api.get(path, params=params, headers=admin_headers)
+    assert response.status_code == 422
+
+
+async def test_largest_page_is_allowed(api, admin_headers):
+    response = await api.get("/api/quotes", params={"limit": server.MAX_PAGE_SIZE}, headers=admin_headers)
+    assert response.status_code == 200
@@ -0,0 +1,22 @@
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_metrics_require_authentication(api):
+    assert (await api.get("/api/metrics")).status_code == 403
+    assert (await api.get("/api/metrics", headers={"Authorization": "Bearer nope"})).status_code == 401
+
+
+async def test_metrics_accept_an_admin_token(api, admin_headers):
+    response = await api.get("/api/metrics", headers=admin_headers)
+    assert response.status_code == 200
+    assert "token_cache_lookups_total" in response.text
+
+
+async def test_metrics_accept_the_scrape_token(api, db, monkeypatch):
+    monkeypatch.setattr(server, "METRICS_TOKEN", "scrape-secret")
+    response = await api.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
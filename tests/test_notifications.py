@@ -0,0 +1,173 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+class StubNotifier:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    async def send(self, notifications):
+        self.batches.append([n["lead_id"] for n in notifications])
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("notifier down")
+
+
+@pytest.fixture
+def outbox(db, monkeypatch):
+    outbox = server.NotificationOutbox(
+        StubNotifier(), batch_size=10, poll_interval=0.01, max_attempts=3,
+        backoff_base=10, backoff_max=60, lease_seconds=30,
+    )
+    monkeypatch.setattr(server, 'notification_outbox', outbox)
+    return outbox
+
+
+async def make_due(db):
+    """Pretend every scheduled retry is due now."""
+    await db.notification_outbox.update_many({}, {"$set": {"next_attempt_at": datetime.now(timezone.utc)}})
+
+
+async def test_submission_writes_outbox_document(api, db, outbox):
+    lead = (await api.post("/api/quotes", json=quote_payload())).json()
+
+    stored = await db.notification_outbox.find_one({})
+    assert stored["lead_id"] == lead["id"]
+    assert stored["status"] == "pending"
+
+
+async def test_batch_is_claimed_and_sent(api, db, outbox):
+    for index in range(3):
+        await api.post("/api/quotes", json=quote_payload(description=f"Lead {index}"))
+
+    batch = await outbox.claim()
+    assert len(batch) == 3
+    assert await outbox.claim() == []
+
+    await outbox.deliver(batch)
+    assert outbox.notifier.batches == [[doc["lead_id"] for doc in batch]]
+    assert await db.notification_outbox.count_documents({"status": "sent"}) == 3
+
+
+async def test_failed_delivery_backs_off_exponentially(db, outbox):
+    outbox.notifier.failures = 2
+    await db.notification_outbox.insert_one(outbox.document("quotes", {"id": "lead-1"}))
+
+    delays = []
+    for _ in range(2):
+        await make_due(db)
+        started = datetime.now(timezone.utc)
+        await outbox.deliver(await outbox.claim())
+        stored = await db.notification_outbox.find_one({})
+        delays.append((stored["next_attempt_at"] - started).total_seconds())
+
+    # Attempt n waits between half and all of base * 2 ** (n - 1)
+    assert 5 <= delays[0] <= 10.5
+    assert 10 <= delays[1] <= 20.5
+    assert stored["status"] == "pending"
+    assert stored["last_error"] == "notifier down"
+
+
+async def test_max_attempts_marks_notification_failed(db, outbox):
+    outbox.notifier.failures = 100
+    await db.notification_outbox.insert_one(outbox.document("quotes", {"id": "lead-1"}))
+
+    for _ in range(outbox.max_attempts):
+        await make_due(db)
+        await outbox.deliver(await outbox.claim())
+
+    stored = await db.notification_outbox.find_one({})
+    assert stored["status"] == "failed"
+    assert stored["attempts"] == outbox.max_attempts
+    await make_due(db)
+    assert await outbox.claim() == []
+
+
+async def test_expired_lease_is_claimed_again(db, outbox):
+    await db.notification_outbox.insert_one(outbox.document("quotes", {"id": "lead-1"}))
+
+    abandoned = await outbox.claim()
+    assert len(abandoned) == 1
+    assert await outbox.claim() == []
+
+    # The worker holding the lease died; once it expires the document is due again
+    await db.notification_outbox.update_many(
+        {}, {"$set": {"next_attempt_at": datetime.now(timezone.utc) - timedelta(seconds=1)}},
+    )
+    reclaimed = await outbox.claim()
+    assert [doc["_id"] for doc in reclaimed] == [abandoned[0]["_id"]]
+
+    # A late completion from the dead worker does not touch the new lease
+    await outbox.deliver(abandoned)
+    assert await db.notification_outbox.count_documents({"status": "sent"}) == 0
+    await outbox.deliver(reclaimed)
+    assert await db.notification_outbox.count_documents({"status": "sent"}) == 1
+
+
+async def test_buffered_submission_writes_lead_before_notification(db, outbox, monkeypatch):
+    queue = server.WriteBehindQueue(10, 0.01, 100, 1)
+    monkeypatch.setattr(server, 'write_behind', queue)
+    order = []
+    original_write = queue.write
+
+    async def recording_write(collection_name, docs):
+        order.append(collection_name)
+        return await original_write(collection_name, docs)
+
+    monkeypatch.setattr(queue, 'write', recording_write)
+    lead = server.QuoteRequest(**quote_payload()).model_dump()
+    await server.insert_submission("quotes", lead, outbox.document("quotes", {"id": lead["id"]}))
+
+    assert await db.notification_outbox.count_documents({}) == 0
+    await queue.flush([await queue.queue.get()])
+    assert order == ["quotes", "notification_outbox"]
+
+
+async def test_mixed_batch_writes_every_lead_before_any_notification(db, outbox, monkeypatch):
+    queue = server.WriteBehindQueue(10, 0.01, 100, 1)
+    order = []
+    original_write = queue.write
+
+    async def recording_write(collection_name, docs):
+        order.append(collection_name)
+        return await original_write(collection_name, docs)
+
+    monkeypatch.setattr(queue, 'write', recording_write)
+    quote = {"id": "quote-1"}
+    consultation = {"id": "consultation-1"}
+    await queue.put([("quotes", quote), ("notification_outbox", outbox.document("quotes", quote))])
+    await queue.put([
+        ("consultations", consultation), ("notification_outbox", outbox.document("consultations", consultation)),
+    ])
+    await queue.flush([await queue.queue.get(), await queue.queue.get()])
+
+    assert order == ["quotes", "consultations", "notification_outbox"]
+    assert await db.notification_outbox.count_documents({}) == 2
+
+
+async def test_dropped_lead_gets_no_notification(db, outbox, monkeypatch):
+    queue = server.WriteBehindQueue(10, 0.01, 100, 1)
+    original_write = queue.write
+
+    async def write_dropping_consultations(collection_name, docs):
+        if collection_name == "consultations":
+            return {doc["id"] for doc in docs}
+        return await original_write(collection_name, docs)
+
+    monkeypatch.setattr(queue, 'write', write_dropping_consultations)
+    quote = {"id": "quote-1"}
+    consultation = {"id": "consultation-1"}
+    await queue.put([("quotes", quote), ("notification_outbox", outbox.document("quotes", quote))])
+    await queue.put([
+        ("consultations", consultation), ("notification_outbox", outbox.document("consultations", consultation)),
+    ])
+    await queue.flush([await queue.queue.get(), await queue.queue.get()])
+
+    assert await db.notification_outbox.distinct("lead_id") == ["quote-1"]
@@ -0,0 +1,39 @@
+import httpx
+import pytest
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def limiter(db, monkeypatch):
+    monkeypatch.setattr(server, 'rate_limiter', server.TokenBucketLimiter(per_minute=1, burst=4))
+
+
+def client_for(peer):
+    transport = httpx.ASGITransport(app=server.app, client=(peer, 50000))
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def submit(http, index, forwarded_for=None):
+    headers = {"X-Forwarded-For": forwarded_for} if forwarded_for else {}
+    response = await http.post("/api/quotes", json=quote_payload(description=f"Lead {index}"), headers=headers)
+    return response.status_code
+
+
+async def test_forwarded_for_is_ignored_without_trusted_proxies(limiter, monkeypatch):
+    monkeypatch.setattr(server, 'TRUSTED_PROXY_COUNT', 0)
+    async with client_for("203.0.113.10") as http:
+        statuses = [await submit(http, i, forwarded_for=f"198.51.100.{i}") for i in range(6)]
+    assert statuses == [200] * 4 + [429] * 2
+
+
+async def test_ingress_hop_is_used_by_default(limiter):
+    async with client_for("10.0.0.1") as http:
+        # The client prepends a fresh fake hop every time; the proxy appends the real address
+        statuses = [await submit(http, i, forwarded_for=f"198.51.100.{i}, 203.0.113.10") for i in range(6)]
+        other_client = await submit(http, 99, forwarded_for="203.0.113.20")
+    assert statuses == [200] * 4 + [429] * 2
+    assert other_client == 200
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def lagging_secondary(db, monkeypatch):
+    """Route non-pinned admin reads to a database that never sees the writes."""
+    secondary = server.client["secondary"]
+    monkeypatch.setattr(server, "read_db", secondary)
+    return secondary
+
+
+async def test_only_the_writing_client_reads_from_the_primary(api, db, admin_headers, lagging_secondary):
+    quote = (await api.post("/api/quotes", json=quote_payload())).json()
+
+    patched = await api.patch(f"/api/quotes/{quote['id']}/status", params={"status": "approved"}, headers=admin_headers)
+    written_at = patched.headers[server.ADMIN_WRITE_HEADER]
+
+    writer = await api.get("/api/quotes", headers={**admin_headers, server.ADMIN_WRITE_HEADER: written_at})
+    assert [item["status"] for item in writer.json()] == ["approved"]
+
+    # Another admin without a recent write of their own stays on the secondary
+    other = await api.get("/api/quotes", headers=admin_headers)
+    assert other.json() == []
+
+
+async def test_writing_client_bypasses_the_stats_cache(api, db, admin_headers, lagging_secondary):
+    assert (await api.get("/api/stats", headers=admin_headers)).json()["total_quotes"] == 0
+    quote = (await api.post("/api/quotes", json=quote_payload())).json()
+
+    response = await api.patch(
+        "/api/quotes/status", json={"status": "approved", "ids": [quote["id"]]}, headers=admin_headers,
+    )
+    pinned = {**admin_headers, server.ADMIN_WRITE_HEADER: response.headers[server.ADMIN_WRITE_HEADER]}
+
+    stats = (await api.get("/api/stats", headers=pinned)).json()
+    assert stats["quotes_by_status"] == {"approved": 1}
+
+
+@pytest.mark.parametrize("value", ["", "not-a-number", str(time.time() - 3600), str(time.time() + 3600)])
+async def test_stale_or_malformed_write_times_do_not_pin(api, db, admin_headers, lagging_secondary, value):
+    await db.quotes.insert_one(server.QuoteRequest(**quote_payload()).model_dump())
+
+    response = await api.get("/api/quotes", headers={**admin_headers, server.ADMIN_WRITE_HEADER: value})
+    assert response.json() == []
@@ -0,0 +1,19 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("weak", [False, True])
+async def test_matching_etag_gets_not_modified(api, weak):
+    etag = (await api.get("/api/services")).headers["ETag"]
+
+    response = await api.get("/api/services", headers={"If-None-Match": f"W/{etag}" if weak else etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+async def test_other_etag_gets_the_catalog(api):
+    response = await api.get("/api/services", headers={"If-None-Match": 'W/"stale", "older"'})
+
+    assert response.status_code == 200
@@ -0,0 +1,44 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+async def store_quote(db, age_seconds):
+    updated_at = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    lead = server.QuoteRequest(**quote_payload(), created_at=updated_at, updated_at=updated_at)
+    await db.quotes.insert_one(lead.model_dump())
+    return lead.id
+
+
+async def test_sync_holds_back_changes_inside_the_safety_lag(api, db, admin_headers):
+    settled = await store_quote(db, server.SYNC_SAFETY_LAG + 60)
+    recent = await store_quote(db, 0)
+
+    first = (await api.get("/api/admin/sync", headers=admin_headers)).json()
+    assert [doc["id"] for doc in first["quotes"]] == [settled]
+
+    # A lead that commits late with an updated_at before the next sync is still picked up
+    late = await store_quote(db, server.SYNC_SAFETY_LAG + 30)
+    second = (await api.get("/api/admin/sync", params={"since": first["since"]}, headers=admin_headers)).json()
+    assert [doc["id"] for doc in second["quotes"]] == [late]
+
+    await db.quotes.update_one(
+        {"id": recent},
+        {"$set": {"updated_at": datetime.now(timezone.utc) - timedelta(seconds=server.SYNC_SAFETY_LAG + 1)}},
+    )
+    third = (await api.get("/api/admin/sync", params={"since": second["since"]}, headers=admin_headers)).json()
+    assert [doc["id"] for doc in third["quotes"]] == [recent]
+
+
+@pytest.mark.parametrize("raw", [[1], 5, "quotes", {"quotes": 5}, {"quotes": ["not a date", "x"]}])
+async def test_malformed_since_token_is_rejected(api, db, admin_headers, raw):
+    token = base64.urlsafe_b64encode(json.dumps(raw).encode()).decode().rstrip("=")
+    response = await api.get("/api/admin/sync", params={"since": token}, headers=admin_headers)
+    assert response.status_code == 400
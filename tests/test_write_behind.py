@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from pymongo.errors import AutoReconnect, BulkWriteError, DocumentTooLarge
+
+import server
+from tests.conftest import quote_payload
+
+pytestmark = pytest.mark.anyio
+
+
+def lead(index):
+    return {"id": f"lead-{index}", "name": f"Lead {index}"}
+
+
+class FlakyCollection:
+    """Wraps a collection and fails the first insert_many calls with the given errors."""
+
+    def __init__(self, collection, errors):
+        self.collection = collection
+        self.errors = list(errors)
+        self.calls = []
+
+    async def insert_many(self, docs, ordered=True):
+        self.calls.append([doc["id"] for doc in docs])
+        if self.errors:
+            error = self.errors.pop(0)
+            if callable(error):
+                error = await error(self.collection, docs)
+            raise error
+        return await self.collection.insert_many(docs, ordered=ordered)
+
+
+@pytest.fixture
+def queue(db):
+    return server.WriteBehindQueue(10, 0.01, 100, 1, retry_base=0, retry_max=0)
+
+
+def patch_collection(monkeypatch, db, flaky):
+    class Database:
+        def __getitem__(self, name):
+            return flaky if name == "quotes" else db[name]
+
+    monkeypatch.setattr(server, 'db', Database())
+
+
+async def test_transient_failure_is_retried(db, queue, monkeypatch):
+    flaky = FlakyCollection(db.quotes, [AutoReconnect("primary stepped down"), AutoReconnect("again")])
+    patch_collection(monkeypatch, db, flaky)
+
+    await queue.write("quotes", [lead(1), lead(2)])
+
+    assert len(flaky.calls) == 3
+    assert await db.quotes.count_documents({}) == 2
+
+
+async def test_only_permanently_rejected_documents_are_dropped(db, queue, monkeypatch):
+    async def partial_insert(collection, docs):
+        # lead-1 is stored, lead-2 fails validation, and the acknowledgement is lost
+        await collection.insert_one(docs[0])
+        return BulkWriteError({
+            "writeErrors": [{"index": 1, "code": 121, "errmsg": "Document failed validation"}],
+            "writeConcernErrors": [{"code": 64, "errmsg": "waiting for replication timed out"}],
+            "nInserted": 1,
+        })
+
+    flaky = FlakyCollection(db.quotes, [partial_insert])
+    patch_collection(monkeypatch, db, flaky)
+
+    await queue.write("quotes", [lead(1), lead(2), lead(3)])
+
+    # The retry re-sends lead-1 (already stored) and lead-3, never lead-2
+    assert flaky.calls[1] == ["lead-1", "lead-3"]
+    assert sorted(await db.quotes.distinct("id")) == ["lead-1", "lead-3"]
+
+
+class OversizeRejectingCollection:
+    """Raises DocumentTooLarge, which is not a PyMongoError, whenever a batch holds lead-bad."""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def insert_many(self, docs, ordered=True):
+        if any(doc["id"] == "lead-bad" for doc in docs):
+            raise DocumentTooLarge("BSON document too large")
+        return await self.collection.insert_many(docs, ordered=ordered)
+
+
+async def test_unstorable_document_is_dropped_alone(db, queue, monkeypatch):
+    patch_collection(monkeypatch, db, OversizeRejectingCollection(db.quotes))
+
+    await queue.write("quotes", [lead(1), {"id": "lead-bad"}, lead(2)])
+
+    assert sorted(await db.quotes.distinct("id")) == ["lead-1", "lead-2"]
+
+
+async def test_consumer_survives_an_unexpected_flush_error(db, queue, monkeypatch):
+    write = queue.write
+    failures = [RuntimeError("boom")]
+
+    async def write_failing_once(collection_name, docs):
+        if failures:
+            raise failures.pop()
+        return await write(collection_name, docs)
+
+    monkeypatch.setattr(queue, "write", write_failing_once)
+    consumer = asyncio.create_task(queue.run())
+    try:
+        await queue.put([("quotes", lead(1))])
+        await asyncio.wait_for(queue.queue.join(), 1)
+        await queue.put([("quotes", lead(2))])
+        await asyncio.wait_for(queue.queue.join(), 1)
+    finally:
+        consumer.cancel()
+
+    assert await db.quotes.distinct("id") == ["lead-2"]
+
+
+async def test_oversized_free_text_is_rejected(api, db):
+    response = await api.post("/api/quotes", json=quote_payload(description="x" * 5001))
+    assert response.status_code == 422